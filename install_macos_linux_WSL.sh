@@ -105,7 +105,7 @@ if [[ "$USER_OS" == "macOS" ]]; then
     fi
 
     brew update
-    brew install ffmpeg poppler libmagic
+    brew install ffmpeg libmagic
 
     echo -e "\n${CYAN}📦 Creating Python virtual environment...${R}"
     python3 -m venv venv
@@ -1,55 +1,728 @@
 import datetime
+import hashlib
 import io
+import mmap
+import multiprocessing
 import os
+import re
 import struct
 import time
 import zipfile
-from concurrent.futures import ThreadPoolExecutor
-
-import cv2
-from PIL import Image, UnidentifiedImageError
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import partial
+from multiprocessing import shared_memory
+
+import numpy as np
+from PIL import Image, ImageOps, UnidentifiedImageError
 from PIL.ExifTags import TAGS
 from PyPDF2 import PdfReader
-from PyPDF2.errors import PdfReadError
-from PySide6.QtCore import QSize, QUrl, QRectF
+from PySide6.QtCore import QSize, QUrl, QRectF, QTimer, QThread
 from PySide6.QtCore import Qt
 from PySide6.QtCore import Signal, Slot
-from PySide6.QtGui import QIcon, QAction, QDesktopServices, QPixmap, QPainter, QImage
+from PySide6.QtGui import QIcon, QAction, QDesktopServices, QPixmap, QPainter, QImage, QImageReader
 from PySide6.QtSvg import QSvgRenderer
 from PySide6.QtWidgets import QListWidget, QListWidgetItem, QToolBar, QSizePolicy, QHBoxLayout, \
     QCheckBox, QHeaderView
 from PySide6.QtWidgets import QMenu
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, QLabel, QTabWidget
-from moviepy.editor import VideoFileClip
-from pdf2image import convert_from_path
+
+CARVING_CHUNK_SIZE = 1024 * 1024 * 100
+# Chunks read from the image extend this far into the next one, so each byte is read about 1.3 times
+CARVING_OVERLAP_SIZE = 1024 * 1024 * 32
+# Carvers never read more than this past a file's start, from read chunks and memory-mapped images alike,
+# so a file starting anywhere in a chunk is carved the same way on both paths
+MAX_CARVED_FILE_SIZE = CARVING_OVERLAP_SIZE
+# Chunks are carved in parallel by this many processes, capped since each holds a chunk in memory
+CARVING_PROCESSES = min(os.cpu_count() or 1, 8)
+CARVING_POLL_INTERVAL = 0.1  # Seconds between checks for a stop request while waiting on a chunk
+THUMBNAIL_PROCESSES = min(os.cpu_count() or 1, 4)  # Processes decoding thumbnails
+
+CARVED_FILES_DIR = "carved_files"
+CARVED_FILES_PREFIX = CARVED_FILES_DIR + os.sep  # Pre-joined so save_file can concatenate instead of os.path.join
+# Kept across runs with the carving output; thumbnails are named by a hash of the file
+THUMBNAIL_CACHE_DIR = os.path.join(CARVED_FILES_DIR, "thumbnails")
+# O_BINARY only exists on Windows, where it stops the CRT from translating newlines
+CARVED_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+CARVED_FILE_WRITERS = 4  # Threads writing carved files to disk
+CARVED_FILE_WRITE_BACKLOG = 64  # Queued writes before carving waits, bounding the carved content held in memory
+
+# Signatures of each carvable type as (magic, distance of the magic from the start of the file, checks).
+# Magics are at most four bytes and are matched as words; each check is (offset from the file start,
+# allowed byte strings) and confirms the rest of a longer signature at every candidate.
+CARVING_SIGNATURES = {
+    'wav': [(b'RIFF', 0, [(8, (b'WAVE',))])],
+    'mov': [(b'moov', 4, []), (b'mdat', 4, []), (b'free', 4, []), (b'wide', 4, [])],  # Type follows atom size
+    'pdf': [(b'%PDF', 0, [(4, (b'-',))])],
+    'jpg': [(b'\xFF\xD8\xFF', 0, [])],
+    'gif': [(b'GIF8', 0, [(4, (b'7a', b'9a'))])],
+    'png': [(b'\x89PNG', 0, [(4, (b'\x0D\x0A\x1A\x0A',))])],
+    'wmv': [(b'\x30\x26\xB2\x75', 0, [(4, (b'\x8E\x66\xCF\x11\xA6\xD9\x00\xAA\x00\x62\xCE\x6C',))])],
+    'zip': [(b'PK\x03\x04', 0, [])],
+    'bmp': [(b'BM', 0, [])],
+}
+
+# Bytes a signature can reach past its candidate start; scans extend this far past a chunk's end so
+# signatures straddling the boundary are still found
+SIGNATURE_SPAN = max(distance + len(magic) for signatures in CARVING_SIGNATURES.values()
+                     for magic, distance, _ in signatures) - 1
+
+# The same signatures with each magic as a little-endian uint32 value and mask, so 2- and 3-byte magics compare too
+SIGNATURE_WORDS = {
+    file_type: [(np.uint32((1 << (8 * len(magic))) - 1), np.uint32(int.from_bytes(magic, 'little')), distance, checks)
+                for magic, distance, checks in signatures]
+    for file_type, signatures in CARVING_SIGNATURES.items()
+}
+
+# End markers of the types carved up to a trailing marker, in the same form as CARVING_SIGNATURES
+END_SIGNATURES = {
+    'jpg': [(b'\xFF\xD9', 0, [])],
+    'gif': [(b'\x00\x3B', 0, [])],
+    'png': [(b'IEND', 0, [(4, (b'\xAE\x42\x60\x82',))])],
+}
+END_SIGNATURE_WORDS = {
+    file_type: [(np.uint32((1 << (8 * len(magic))) - 1), np.uint32(int.from_bytes(magic, 'little')), distance, checks)
+                for magic, distance, checks in signatures]
+    for file_type, signatures in END_SIGNATURES.items()
+}
+# End markers are only all found up to this many bytes before the end of a scanned chunk
+END_SIGNATURE_MARGIN = 8
+
+MOV_ATOM_TYPES = {b'moov', b'mdat', b'free', b'wide'}
+
+# Unallocated space is often zero-filled: all-zero blocks are found first and only the rest is scanned.
+# Zero runs shorter than ZERO_GAP_SIZE are scanned anyway, so a fragmented chunk is not split into many small scans.
+ZERO_BLOCK_SIZE = 4096
+ZERO_GAP_SIZE = 1024 * 1024
+
+# Precompiled layouts of the header fields the carvers walk, read in place with unpack_from
+MOV_ATOM_HEADER = struct.Struct('>I4s')  # Atom size, atom type
+ZIP_LOCAL_HEADER = struct.Struct('<4s14xI4xHH')  # Signature, compressed size, name length, extra length
+ZIP_COMMENT_LENGTH = struct.Struct('<H')  # At offset 20 of the End of Central Directory Record
+WMV_FILE_SIZE = struct.Struct('<Q')  # At offset 40 of the ASF file properties object
+BMP_HEADER = struct.Struct('<2xI12xII')  # File size, then width and height from the info header
+PNG_IHDR_CHUNK = struct.Struct('>I4sII5xI')  # Length, type, width, height, CRC; the CRC covers type and data
+JPEG_SEGMENT_LENGTH = struct.Struct('>H')
+PDF_TRAILER = re.compile(rb'startxref\s+\d+\s+%%EOF')  # Cross-reference offset before the EOF marker
+JPEG_STANDALONE_MARKERS = {0x01} | set(range(0xD0, 0xD8))  # TEM and RST0-7 carry no length
+
+
+def confirm_signature(data, starts, checks):
+    """Keep the starts whose bytes pass every check, comparing all candidates at once.
+
+    Candidates whose checked bytes run past the end of data are kept for the carver to verify.
+    """
+    keep = np.ones(len(starts), dtype=bool)
+    for check_offset, alternatives in checks:
+        matched = np.zeros(len(starts), dtype=bool)
+        for literal in alternatives:
+            positions = starts + check_offset
+            in_range = positions + len(literal) <= len(data)
+            literal_match = np.ones(np.count_nonzero(in_range), dtype=bool)
+            for i, byte in enumerate(literal):
+                literal_match &= data[positions[in_range] + i] == byte
+            matched[in_range] |= literal_match
+            matched |= ~in_range
+        keep &= matched
+    return starts[keep]
+
+
+def find_signature_offsets(chunk, file_types, signature_words=SIGNATURE_WORDS):
+    """Return the sorted candidate start offsets in chunk for each of file_types.
+
+    The chunk is viewed as uint32 words at each of the four byte alignments and every
+    signature is located with vectorised compares, in place of one bytes.find loop per type.
+    """
+    data = np.frombuffer(chunk, dtype=np.uint8)
+    hits = {file_type: [] for file_type in file_types}
+    for shift in range(4):
+        count = (len(chunk) - shift) // 4
+        if count <= 0:
+            break
+        words = np.frombuffer(chunk, dtype='<u4', count=count, offset=shift)
+        masked_words = {}  # Masked views are shared by all signatures of the same length
+        for file_type in file_types:
+            for mask, value, distance, checks in signature_words.get(file_type, ()):
+                if mask not in masked_words:
+                    masked_words[mask] = words if mask == 0xFFFFFFFF else words & mask
+                starts = np.flatnonzero(masked_words[mask] == value) * 4 + (shift - distance)
+                starts = starts[starts >= 0]
+                if checks:
+                    starts = confirm_signature(data, starts, checks)
+                hits[file_type].append(starts)
+    return {file_type: np.unique(np.concatenate(parts)) if parts else np.empty(0, dtype=np.intp)
+            for file_type, parts in hits.items()}
+
+
+def nonzero_regions(chunk):
+    """Return the (start, stop) regions of chunk left after removing long runs of zero blocks.
+
+    Regions are widened by SIGNATURE_SPAN so signatures that reach into a zero run are still found.
+    """
+    blocks = len(chunk) // ZERO_BLOCK_SIZE
+    words = np.frombuffer(chunk, dtype=np.uint64, count=blocks * ZERO_BLOCK_SIZE // 8)
+    nonzero = words.reshape(blocks, ZERO_BLOCK_SIZE // 8).any(axis=1)
+    if len(chunk) % ZERO_BLOCK_SIZE:
+        nonzero = np.append(nonzero, True)  # The partial last block is always scanned
+    nonzero_blocks = np.flatnonzero(nonzero)
+    if not len(nonzero_blocks):
+        return []
+    splits = np.flatnonzero(np.diff(nonzero_blocks) > ZERO_GAP_SIZE // ZERO_BLOCK_SIZE)
+    region_starts = nonzero_blocks[np.r_[0, splits + 1]] * ZERO_BLOCK_SIZE - SIGNATURE_SPAN
+    region_stops = (nonzero_blocks[np.r_[splits, len(nonzero_blocks) - 1]] + 1) * ZERO_BLOCK_SIZE + SIGNATURE_SPAN
+    return [(max(start, 0), min(stop, len(chunk)))
+            for start, stop in zip(region_starts.tolist(), region_stops.tolist())]
+
+
+def find_signature_offsets_in_regions(chunk, regions, file_types, signature_words=SIGNATURE_WORDS):
+    """Like find_signature_offsets, but only scanning the given ascending, disjoint regions of chunk."""
+    if regions == [(0, len(chunk))]:
+        return find_signature_offsets(chunk, file_types, signature_words)
+    chunk_view = memoryview(chunk)
+    hits = {file_type: [] for file_type in file_types}
+    for start, stop in regions:
+        for file_type, offsets in find_signature_offsets(chunk_view[start:stop], file_types, signature_words).items():
+            hits[file_type].append(offsets + start)
+    return {file_type: np.concatenate(parts) if parts else np.empty(0, dtype=np.intp)
+            for file_type, parts in hits.items()}
+
+
+def quick_validate_png(data):
+    """Check the PNG's IHDR chunk: its length, sane dimensions and its CRC."""
+    if len(data) < 8 + PNG_IHDR_CHUNK.size:
+        return False
+    length, chunk_type, width, height, crc = PNG_IHDR_CHUNK.unpack_from(data, 8)
+    return (length == 13 and chunk_type == b'IHDR' and width > 0 and height > 0
+            and zlib.crc32(data[12:29]) == crc)
+
+
+def quick_validate_jpg(data):
+    """Walk the JPEG's marker segments from SOI to the start of scan, checking each stays in the data."""
+    position = 2
+    while position + 4 <= len(data):
+        if data[position] != 0xFF:
+            return False
+        marker = data[position + 1]
+        if marker == 0xFF:  # Fill byte before a marker
+            position += 1
+        elif marker == 0xDA:  # Start of scan: entropy-coded data follows up to EOI
+            return True
+        elif marker in JPEG_STANDALONE_MARKERS:
+            position += 2
+        else:
+            segment_length, = JPEG_SEGMENT_LENGTH.unpack_from(data, position + 2)
+            if segment_length < 2:
+                return False
+            position += 2 + segment_length
+    return False
+
+
+def quick_validate_pdf(data):
+    """Check for the PDF header and, in the last KiB, a numeric cross-reference offset before %%EOF.
+
+    These are what PyPDF2 looks for first when opening a PDF, and it rejects files without them.
+    """
+    return data.startswith(b'%PDF-') and PDF_TRAILER.search(data[-1024:]) is not None
+
+
+# Structural checks on a few header or trailer bytes that reject most false positives before the far
+# slower full parse. Images passing them are still verified by PIL; for PDFs they are the whole check.
+QUICK_VALIDATORS = {
+    'png': quick_validate_png,
+    'jpg': quick_validate_jpg,
+    'pdf': quick_validate_pdf,
+}
+
+
+def is_valid_file(data, file_type):
+    quick_validate = QUICK_VALIDATORS.get(file_type)
+    if quick_validate is not None and not quick_validate(data):
+        return False
+    try:
+        if file_type == 'pdf':
+            # quick_validate_pdf checked the trailer PyPDF2 needs to open the file
+            return True
+        elif file_type in ['jpg', 'jpeg', 'png', 'gif']:
+            # Validate images by attempting to open them with PIL
+            try:
+                image = Image.open(io.BytesIO(data))
+                image.verify()  # This will not load the image but only parse it
+            except Image.DecompressionBombError as e:
+                # The header parsed but exceeds PIL's pixel limit; keep it as evidence without decoding it
+                print(f"Not decoding oversized {file_type} image: {e}")
+        elif file_type == 'bmp':
+            return True
+        elif file_type == 'wav':
+            # Basic WAV validation could check for the RIFF header, file size, etc.
+            if not data.startswith(b'RIFF') or not b'WAVE' in data[:12]:
+                return False
+            # Additional WAV format checks could be implemented here
+        elif file_type == 'mov':
+            return True  # For now, we'll assume all MOV files are valid
+        else:
+            return True
+        return True
+    except (IOError, UnidentifiedImageError, ValueError) as e:
+        print(f"Error validating file of type {file_type}: {str(e)}")
+        return False
+
+
+# Each carve_*_file function carves one file whose signature starts at start_index in the chunk and
+# returns (index from which scanning for that type resumes, carved content or None). Carvers of
+# types in END_SIGNATURES also take the index of the first end marker after start_index when known. The functions
+# are module-level and free of widget state so carving worker processes can run them. The chunk is
+# either a chunk read into shared memory or the whole memory-mapped image, so reads are bounded by limit.
+
+def carve_pdf_file(chunk, start_index):
+    limit = min(len(chunk), start_index + MAX_CARVED_FILE_SIZE)
+    if chunk[start_index + 4:start_index + 5] != b'-':  # Full signature is '%PDF-'
+        return start_index + 1, None
+    linearization_index = chunk.find(b'/Linearized', start_index, start_index + 1024)
+    if linearization_index != -1:
+        file_size_marker = chunk.find(b'/L ', linearization_index, linearization_index + 1024)
+        file_size_start = file_size_marker + 3
+        file_size_end = chunk.find(b'/', file_size_start, limit)
+        if file_size_end == -1:
+            file_size_end = chunk.find(b' ', file_size_start, limit)
+        if file_size_marker != -1 and file_size_end != -1:
+            try:
+                file_size = int(chunk[file_size_start:file_size_end].split()[0])
+                pdf_content = chunk[start_index:min(start_index + file_size, limit)]
+                if is_valid_file(pdf_content, 'pdf'):
+                    return start_index + file_size, pdf_content
+            except (ValueError, IndexError):
+                pass
+    end_index = chunk.find(b'%%EOF', start_index, limit)
+    if end_index == -1:
+        return start_index + 1, None
+    end_index += len(b'%%EOF')
+    pdf_content = chunk[start_index:end_index]
+    return end_index, pdf_content if is_valid_file(pdf_content, 'pdf') else None
+
+
+def carve_wav_file(chunk, start_index):
+    if chunk[start_index + 8:start_index + 12] != b'WAVE':
+        return start_index + 4, None
+
+    file_size_bytes = chunk[start_index + 4:start_index + 8]
+    file_size = int.from_bytes(file_size_bytes, byteorder='little') + 8
+    end_index = min(start_index + file_size, len(chunk), start_index + MAX_CARVED_FILE_SIZE)
+
+    wav_content = chunk[start_index:end_index]
+    return end_index, wav_content if is_valid_file(wav_content, 'wav') else None
+
+
+def carve_mov_file(chunk, start_index):
+    limit = min(len(chunk), start_index + MAX_CARVED_FILE_SIZE)
+    current_offset = start_index
+
+    # Collect consecutive top-level atoms of known types
+    while current_offset + 8 <= limit:
+        atom_size, atom_type = MOV_ATOM_HEADER.unpack_from(chunk, current_offset)
+        if atom_type not in MOV_ATOM_TYPES or atom_size < 8 or current_offset + atom_size > limit:
+            # End of the MOV file, or an atom that cannot be complete
+            break
+        current_offset += atom_size
+
+    if current_offset == start_index:
+        return start_index + 1, None
+    # Atoms are contiguous, so the file is one slice up to the end of the last accepted atom
+    return current_offset, chunk[start_index:current_offset]
+
+
+def carve_jpg_file(chunk, start_index, end_index=None):
+    jpg_end_signature = b'\xFF\xD9'
+    limit = min(len(chunk), start_index + MAX_CARVED_FILE_SIZE)
+    if end_index is None:
+        end_index = chunk.find(jpg_end_signature, start_index, limit)
+    elif end_index + len(jpg_end_signature) > limit:
+        end_index = -1  # The first end marker is out of bounds
+    if end_index == -1:
+        return start_index + 1, None
+    end_index += len(jpg_end_signature)
+
+    # Check if it's a valid JPG file
+    jpg_content = chunk[start_index:end_index]
+    return end_index, jpg_content if is_valid_file(jpg_content, 'jpg') else None
+
+
+def carve_gif_file(chunk, start_index, end_index=None):
+    gif_end_signature = b'\x00\x3B'
+    limit = min(len(chunk), start_index + MAX_CARVED_FILE_SIZE)
+    if end_index is None:
+        end_index = chunk.find(gif_end_signature, start_index, limit)
+    elif end_index + len(gif_end_signature) > limit:
+        end_index = -1  # The first end marker is out of bounds
+    if end_index == -1:
+        return start_index + 1, None
+    end_index += len(gif_end_signature)
+
+    # Check if it's a valid GIF file
+    gif_content = chunk[start_index:end_index]
+    return end_index, gif_content if is_valid_file(gif_content, 'gif') else None
+
+
+def carve_png_file(chunk, start_index, end_index=None):
+    png_start_signature = b'\x89\x50\x4E\x47\x0D\x0A\x1A\x0A'
+    png_end_signature = b'\x49\x45\x4E\x44\xAE\x42\x60\x82'
+    if chunk[start_index:start_index + len(png_start_signature)] != png_start_signature:
+        return start_index + 1, None
+    limit = min(len(chunk), start_index + MAX_CARVED_FILE_SIZE)
+    if end_index is None:
+        end_index = chunk.find(png_end_signature, start_index, limit)
+    elif end_index + len(png_end_signature) > limit:
+        end_index = -1  # The first end marker is out of bounds
+    if end_index == -1:
+        return start_index + 1, None
+    end_index += len(png_end_signature)
+
+    # Check if it's a valid PNG file
+    png_content = chunk[start_index:end_index]
+    return end_index, png_content if is_valid_file(png_content, 'png') else None
+
+
+def carve_wmv_file(chunk, start_index):
+    # ASF header object GUID
+    asf_header_signature = b'\x30\x26\xB2\x75\x8E\x66\xCF\x11\xA6\xD9\x00\xAA\x00\x62\xCE\x6C'
+    if chunk[start_index:start_index + len(asf_header_signature)] != asf_header_signature:
+        return start_index + 1, None
+
+    # Find the file properties object header within the first 512 bytes of the file
+    limit = min(len(chunk), start_index + MAX_CARVED_FILE_SIZE)
+    max_search_size = min(start_index + 512, limit)
+    file_properties_header = b'\xA1\xDC\xAB\x8C\x47\xA9\xCF\x11\x8E\xE4\x00\xC0\x0C\x20\x53\x65'
+    file_properties_index = chunk.find(file_properties_header, start_index, max_search_size)
+    if file_properties_index == -1:
+        return start_index + 1, None
+
+    # Extract the file size located at offset 40 within the object
+    file_size_offset = file_properties_index + 40
+    if file_size_offset + WMV_FILE_SIZE.size > limit:
+        return start_index + 1, None
+    file_size, = WMV_FILE_SIZE.unpack_from(chunk, file_size_offset)
+    if file_size <= 0:
+        return start_index + 1, None
+
+    # Calculate end index based on file size
+    end_index = min(start_index + file_size, limit)
+    return end_index, chunk[start_index:end_index]
+
+
+def carve_zip_file(chunk, start_index):
+    local_file_header_signature = b'\x50\x4b\x03\x04'
+    end_of_central_dir_signature = b'\x50\x4b\x05\x06'
+
+    limit = min(len(chunk), start_index + MAX_CARVED_FILE_SIZE)
+
+    # Walk the consecutive local file entries
+    current_pos = start_index
+    while current_pos + ZIP_LOCAL_HEADER.size <= limit:
+        signature, compressed_size, name_length, extra_length = ZIP_LOCAL_HEADER.unpack_from(chunk, current_pos)
+        if signature != local_file_header_signature:
+            break
+        current_pos += ZIP_LOCAL_HEADER.size + name_length + extra_length + compressed_size
+
+    # Then include the Central Directory and End of Central Directory Record
+    zip_end = current_pos
+    end_central_dir_index = chunk.find(end_of_central_dir_signature, current_pos, limit)
+    if end_central_dir_index != -1 and end_central_dir_index + 22 <= limit:
+        comment_length, = ZIP_COMMENT_LENGTH.unpack_from(chunk, end_central_dir_index + 20)
+        zip_end = end_central_dir_index + 22 + comment_length
+
+    zip_end = min(zip_end, limit)
+    return max(zip_end, start_index + 1), chunk[start_index:zip_end]
+
+
+def carve_bmp_file(chunk, start_index):
+    # Verify there's enough chunk left to read the BMP header and dimensions
+    if start_index + BMP_HEADER.size > len(chunk):
+        return start_index + 2, None
+
+    # Read file size and dimensions directly from the header
+    bmp_file_size, bmp_width, bmp_height = BMP_HEADER.unpack_from(chunk, start_index)
+
+    # Sanity check for BMP size (adjust max and min size as per your need)
+    if bmp_file_size < 100 or bmp_file_size > 5000000:
+        return start_index + 2, None  # Not a valid BMP size, skip to next possible start
+
+    # Reasonable dimensions check (adjust max width/height as per your need)
+    if bmp_width <= 0 or bmp_width > 10000 or bmp_height <= 0 or bmp_height > 10000:
+        return start_index + 2, None  # Unreasonable dimensions, likely not a BMP
+
+    # Extract the BMP file only if it's entirely within the chunk
+    if start_index + bmp_file_size > len(chunk):
+        return start_index + 2, None
+    return start_index + bmp_file_size, chunk[start_index:start_index + bmp_file_size]
+
+
+# Dispatch table from file type to its carve function
+CARVERS = {
+    'wav': carve_wav_file,
+    'mov': carve_mov_file,
+    'pdf': carve_pdf_file,
+    'jpg': carve_jpg_file,
+    'gif': carve_gif_file,
+    'png': carve_png_file,
+    'wmv': carve_wmv_file,
+    'zip': carve_zip_file,
+    'bmp': carve_bmp_file,
+}
+
+
+def carve_chunk(carve_buffer, buffer_offset, chunk, chunk_offset, scan_length, carvers):
+    """Carve every file whose signature starts in the first scan_length bytes of chunk, with carvers
+    mapping each selected type to its carver.
+
+    carve_buffer starts at image offset buffer_offset and contains chunk, which starts at
+    chunk_offset. Returns (file type, image offset, image offset to resume from, content)
+    for each carved file, in ascending offset order per type.
+    """
+    carved = []
+    buffer_shift = chunk_offset - buffer_offset
+    regions = nonzero_regions(chunk)
+    if not regions:
+        return carved
+    candidates = find_signature_offsets_in_regions(chunk, regions, carvers)
+    end_candidates = find_signature_offsets_in_regions(
+        chunk, regions, [file_type for file_type in carvers if file_type in END_SIGNATURES], END_SIGNATURE_WORDS)
+    for file_type, carve in carvers.items():
+        resume_index = 0
+        starts = candidates[file_type]
+        starts = starts[:np.searchsorted(starts, scan_length)]  # Later starts belong to the next chunk
+        if file_type in end_candidates:
+            # Pair each start with the first end marker after it in one sorted search; -1 leaves starts
+            # past the last reliably found end marker to search for theirs
+            ends = end_candidates[file_type]
+            ends = ends[:np.searchsorted(ends, len(chunk) - END_SIGNATURE_MARGIN)]
+            paired = np.searchsorted(ends, starts)
+            end_indices = np.append(ends + buffer_shift, -1)[paired].tolist()
+        else:
+            end_indices = [-1] * len(starts)
+        # Skip candidates inside a file of the same type already carved from this chunk
+        for start_index, end_index in zip((starts + buffer_shift).tolist(), end_indices):
+            if start_index >= resume_index:
+                if end_index >= 0:
+                    resume_index, content = carve(carve_buffer, start_index, end_index)
+                else:
+                    resume_index, content = carve(carve_buffer, start_index)
+                if content is not None:
+                    carved.append((file_type, buffer_offset + start_index, buffer_offset + resume_index, content))
+    return carved
+
+
+def carve_mapped_chunk(image_path, chunk_offset, chunk_size, carvers):
+    """Carving process entry point for raw images, which each process memory-maps itself."""
+    with open(image_path, 'rb') as image_file, \
+            mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as image_map:
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):  # Not available on Windows
+            # Chunks are read front to back, so the kernel can read ahead and drop pages behind
+            image_map.madvise(mmap.MADV_SEQUENTIAL)
+        image_view = memoryview(image_map)
+        chunk = image_view[chunk_offset:chunk_offset + chunk_size + SIGNATURE_SPAN]
+        try:
+            return carve_chunk(image_map, 0, chunk, chunk_offset, chunk_size, carvers)
+        finally:
+            chunk.release()
+            image_view.release()
+
+
+def carve_shared_chunk(shared_chunk_name, chunk_offset, chunk_length, chunk_size, carvers):
+    """Carving process entry point for chunks the carving thread read into shared memory.
+
+    The chunk holds chunk_size bytes to scan followed by the overlap into the next chunk,
+    which carvers may read but where no signature is scanned.
+    """
+    shared_chunk = shared_memory.SharedMemory(name=shared_chunk_name)
+    # The chunk is carved in place: carvers search the mmap backing the shared memory, as they do a
+    # raw image's, and only the carved files are copied out of it
+    chunk_map = shared_chunk._mmap
+    scan_view = shared_chunk.buf[:min(chunk_size + SIGNATURE_SPAN, chunk_length)]
+    try:
+        return carve_chunk(chunk_map, chunk_offset, scan_view, chunk_offset, chunk_size, carvers)
+    finally:
+        scan_view.release()  # Views must be released before the shared memory can be closed
+        shared_chunk.close()
+
+
+# Thumbnail makers, which run in thumbnail processes rather than on the GUI thread and return PNG
+# bytes. Video and PDF libraries are imported there on first use.
+
+def make_image_thumbnail(file_path):
+    # PIL's pixel limit stays in place: carved images are untrusted input and are decoded here
+    try:
+        with Image.open(file_path) as image:
+            # Lets JPEG decode straight at a reduced DCT scale that still covers the thumbnail
+            image.draft('RGB', (120, 120))
+            if image.mode not in ('RGB', 'RGBA', 'L', 'P'):
+                image = image.convert('RGB')  # e.g. CMYK JPEGs, which PNG cannot store
+            # Center-crop to a square at thumbnail size, as center_crop_to_square does
+            thumbnail = ImageOps.fit(image, (120, 120), Image.LANCZOS)
+    except Image.DecompressionBombError as e:
+        print(f"Not making a thumbnail of oversized image {file_path}: {e}")
+        return None
+    buffer = io.BytesIO()
+    thumbnail.save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def encode_video_thumbnail(frame):
+    """Center-crop a video frame to a square, shrink it to thumbnail size and return it as PNG bytes."""
+    import cv2
+    height, width = frame.shape[:2]
+    side = min(height, width)
+    top, left = (height - side) // 2, (width - side) // 2
+    thumbnail = cv2.resize(frame[top:top + side, left:left + side], (120, 120), interpolation=cv2.INTER_AREA)
+    _, png = cv2.imencode('.png', thumbnail)
+    return png.tobytes()
+
+
+def make_mov_thumbnail(file_path):
+    import cv2
+    capture = cv2.VideoCapture(file_path)
+    capture.set(cv2.CAP_PROP_POS_MSEC, 500)  # Frame at 0.5 seconds
+    success, frame = capture.read()
+    if not success:
+        # Clips shorter than half a second fall back to their first frame
+        capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        success, frame = capture.read()
+    capture.release()
+    if not success:
+        print("Failed to extract thumbnail from MOV file")
+        return None
+    return encode_video_thumbnail(frame)
+
+
+def make_pdf_thumbnail(file_path):
+    from fitz import open as fitz_open, Matrix
+    # Rasterize only the first page, in process and directly at thumbnail width
+    with fitz_open(file_path) as pdf:
+        page = pdf[0]
+        zoom = 120 / page.rect.width
+        return page.get_pixmap(matrix=Matrix(zoom, zoom)).tobytes('png')
+
+
+def make_wmv_thumbnail(file_path):
+    import cv2
+    capture = cv2.VideoCapture(file_path)
+    success, image = capture.read()
+    capture.release()  # Release the capture object explicitly
+    if not success:
+        print("Failed to extract thumbnail from WMV file")
+        return None
+    return encode_video_thumbnail(image)
+
+
+THUMBNAIL_MAKERS = {
+    'jpg': make_image_thumbnail,
+    'png': make_image_thumbnail,
+    'gif': make_image_thumbnail,
+    'bmp': make_image_thumbnail,
+    'mov': make_mov_thumbnail,
+    'pdf': make_pdf_thumbnail,
+    'wmv': make_wmv_thumbnail,
+}
+
+
+def thumbnail_cache_key(file_content):
+    """Identify a carved file for the thumbnail cache by a hash of its whole content.
+
+    Files that only share a header and size must not share a thumbnail.
+    """
+    return hashlib.blake2b(file_content, digest_size=16).hexdigest()
+
+
+def make_cached_thumbnail(thumbnail_maker, file_path, cache_path):
+    """Make a thumbnail in a thumbnail process and keep a copy at cache_path for later runs."""
+    png = thumbnail_maker(file_path)
+    if png:
+        try:
+            with open(cache_path, 'wb') as cache_file:
+                cache_file.write(png)
+        except OSError as e:
+            print(f"Error caching thumbnail {cache_path}: {e}")
+    return png
+
+
+def format_carved_timestamp(timestamp):
+    """Format a carved file's epoch timestamp; done when shown rather than for every carved file."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+
+
+@dataclass(slots=True)
+class CarvedFile:
+    """What the carving tab keeps about a carved file, keyed by its file name."""
+    size: int
+    file_type: str
+    path: str
+    modification_date: float = None  # Seconds since the epoch, set once the file is written
+    thumbnail_key: str = None  # Thumbnail cache key, for types whose thumbnails are decoded from the file
 
 
 class NumericTableWidgetItem(QTableWidgetItem):
-    def __lt__(self, other):
-        self_value = self.text().split()[0]  # Extract numeric part of the text
-        other_value = other.text().split()[0]  # Extract numeric part of the text
-        self_unit = self.text().split()[1]  # Extract unit part of the text
-        other_unit = other.text().split()[1]  # Extract unit part of the text
+    """Table item showing a readable size that sorts by its byte count, computed once per item."""
+
+    def __init__(self, text, byte_value=None):
+        super().__init__(text)
+        self.byte_value = byte_value if byte_value is not None else self.parse_readable_size(text)
+
+    @staticmethod
+    def parse_readable_size(text):
+        value, unit = text.split()[:2]  # Numeric and unit parts of the text
         units = {'B': 0, 'KB': 1, 'MB': 2, 'GB': 3, 'TB': 4}
+        return float(value) * (1024 ** units[unit])
+
+    def __lt__(self, other):
+        return self.byte_value < other.byte_value
+
+
+class CarvingWorker(QThread):
+    """Runs the carving loop off the GUI thread.
 
-        # Convert to bytes for comparison
-        self_bytes = float(self_value) * (1024 ** units[self_unit])
-        other_bytes = float(other_value) * (1024 ** units[other_unit])
+    Carved rows reach the UI only through the widget's queue and batch timer, and
+    button state is restored from the finished signal on the GUI thread.
+    """
 
-        return self_bytes < other_bytes
+    def __init__(self, carving_widget, selected_file_types):
+        super().__init__()
+        self.carving_widget = carving_widget
+        self.selected_file_types = selected_file_types
+
+    def run(self):
+        try:
+            self.carving_widget.carve_files(self.selected_file_types)
+        except Exception as e:
+            print(f"Error during carving: {e}")
 
 
 class FileCarvingWidget(QWidget):
-    file_carved = Signal(str, str, str, str, str)  # Unified signal for file carving
+    files_carved = Signal(list)  # Batch of (name, size, type, modification date, path) rows
+    thumbnail_ready = Signal(str, object)  # File name and the finished future of its thumbnail
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.main_window = parent  # Store reference to MainWindow before it gets reparented by tab widget
         self.image_handler = None
-        self.executor = ThreadPoolExecutor(max_workers=4)  # ThreadPoolExecutor for background tasks
-        self.carved_files = []
-        self.carved_file_names = set()  # Track carved file names to avoid duplicates
+        self.carving_worker = None  # CarvingWorker thread for the current carve
+        self.clear_when_finished = False  # Set when clear() interrupts a carve, whose late rows are then dropped
+        self.carved_files = {}  # File name -> CarvedFile, for lookups and to avoid carving duplicates
         self.allocation_map = []  # Map of allocated disk regions to skip during carving
+        self.pending_carved_files = deque()  # Rows queued by the writer threads, drained on the GUI thread
+        self.writer_pool = ThreadPoolExecutor(max_workers=CARVED_FILE_WRITERS)  # Writes carved files off the carving thread
+        self.pending_writes = deque()  # Futures of queued writes, oldest first
+        # Spawned rather than forked, as forking this multithreaded process can deadlock the children
+        self.thumbnail_pool = ProcessPoolExecutor(max_workers=THUMBNAIL_PROCESSES,
+                                                  mp_context=multiprocessing.get_context('spawn'))
+        self.thumbnail_items = {}  # File name -> list item still waiting for its thumbnail
+        self.thumbnail_futures = {}  # File name -> future of the thumbnail being made for its list item
+        self.cached_thumbnails = set()  # File names in THUMBNAIL_CACHE_DIR, listed once per carve
+
+        # Flush queued rows to the UI periodically instead of signalling once per carved file
+        self.batch_timer = QTimer(self)
+        self.batch_timer.setInterval(100)
+        self.batch_timer.timeout.connect(self.flush_carved_files)
+
         self.init_ui()
 
     def init_ui(self):
@@ -112,7 +785,8 @@ class FileCarvingWidget(QWidget):
         self.toolbar.addWidget(self.stop_button)
         self.layout.addWidget(self.tab_widget)
 
-        self.file_carved.connect(self.display_carved_file)
+        self.files_carved.connect(self.display_carved_files)
+        self.thumbnail_ready.connect(self.set_thumbnail)
 
     def create_table_widget(self):
         table_widget = QTableWidget()
@@ -241,6 +915,24 @@ class FileCarvingWidget(QWidget):
         # Scale to target size
         return cropped.scaled(target_size, target_size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
 
+    @staticmethod
+    def load_scaled_pixmap(image_path, target_size):
+        """Decode an image file straight at thumbnail scale, keeping its shorter side at target_size."""
+        reader = QImageReader(image_path)
+        size = reader.size()
+        side = min(size.width(), size.height())
+        if side > target_size:
+            # Lets the decoder (e.g. JPEG scaled IDCT) skip materialising the full-resolution image
+            reader.setScaledSize(QSize(target_size * size.width() // side, target_size * size.height() // side))
+        return QPixmap.fromImage(reader.read())
+
+    @staticmethod
+    def pixmap_from_bytes(data, image_format='PNG'):
+        """Decode encoded image bytes held in memory into a QPixmap."""
+        pixmap = QPixmap()
+        pixmap.loadFromData(data, image_format)
+        return pixmap
+
     @staticmethod
     def render_svg_to_pixmap(svg_path, target_size):
         """Render SVG file at target resolution for crisp icons."""
@@ -280,14 +972,12 @@ class FileCarvingWidget(QWidget):
         self.stop_button.setEnabled(True)
         self.clear_ui()
         self.carved_files.clear()
-        self.carved_file_names.clear()
 
-        # Ensure the 'carved_files' and 'thumbnails' directories exist
-        if not os.path.exists("carved_files"):
-            os.makedirs("carved_files")
-        thumbnail_folder = os.path.join("carved_files", "thumbnails")
-        if not os.path.exists(thumbnail_folder):
-            os.makedirs(thumbnail_folder)
+        # Create the 'carved_files' directory once per run so save_file never has to probe for it
+        os.makedirs(CARVED_FILES_DIR, exist_ok=True)
+        os.makedirs(THUMBNAIL_CACHE_DIR, exist_ok=True)
+        # One directory listing replaces a stat of the cache for every carved file shown
+        self.cached_thumbnails = set(os.listdir(THUMBNAIL_CACHE_DIR))
 
         # Build allocation map for all partitions to skip allocated files
         print("Building allocation map for allocated files...")
@@ -324,16 +1014,31 @@ class FileCarvingWidget(QWidget):
 
         selected_file_types = [fileType.lower() for fileType, checkbox in self.fileTypes.items() if
                                checkbox.isChecked()]
-        self.executor.submit(self.carve_files, selected_file_types)
+        self.carving_worker = CarvingWorker(self, selected_file_types)
+        self.carving_worker.finished.connect(self.on_carving_finished)
+        self.batch_timer.start()
+        self.carving_worker.start()
 
     def stop_carving(self):
-        self.executor.shutdown(wait=True)  # Properly shutdown the executor
-        self.start_button.setEnabled(True)  # Re-enable the start button
+        # Ask the worker to stop; buttons are reset once it has finished
+        if self.carving_worker and self.carving_worker.isRunning():
+            self.carving_worker.requestInterruption()
+        self.stop_button.setEnabled(False)  # Disable the stop button
+
+    def on_carving_finished(self):
+        if self.clear_when_finished:
+            # Drop what the interrupted carve wrote after clear(); every write has completed by now
+            self.clear_when_finished = False
+            self.batch_timer.stop()
+            self.pending_carved_files.clear()
+            self.carved_files.clear()
+        self.start_button.setEnabled(self.image_handler is not None)  # Re-enable the start button
         self.stop_button.setEnabled(False)  # Disable the stop button
 
     def set_image_handler(self, image_handler):
         self.image_handler = image_handler
-        self.start_button.setEnabled(True)
+        # A carve interrupted by clear() may still be stopping; on_carving_finished enables the button then
+        self.start_button.setEnabled(not (self.carving_worker and self.carving_worker.isRunning()))
 
     @staticmethod
     def is_offset_allocated(offset, chunk_size, allocation_map):
@@ -385,29 +1090,23 @@ class FileCarvingWidget(QWidget):
             current_item = self.list_widget.currentItem()
 
         if current_item:
-            file_name = current_item.text()
-            for file_info in self.carved_files:
-                if file_info[0] == file_name:
-                    file_path = file_info[3]  # The file path is now at index 3
-                    QDesktopServices.openUrl(QUrl.fromLocalFile(file_path))
-                    break
+            carved_file = self.carved_files.get(current_item.text())
+            if carved_file:
+                QDesktopServices.openUrl(QUrl.fromLocalFile(carved_file.path))
 
     def open_file_location(self):
         current_item = self.list_widget.currentItem()
         if current_item:
-            file_name = current_item.text()
-            for file_info in self.carved_files:
-                if file_info[0] == file_name:
-                    file_path = file_info[3]  # The file path is now at index 3
-                    QDesktopServices.openUrl(QUrl.fromLocalFile(os.path.dirname(file_path)))
-                    break
+            carved_file = self.carved_files.get(current_item.text())
+            if carved_file:
+                QDesktopServices.openUrl(QUrl.fromLocalFile(os.path.dirname(carved_file.path)))
 
     def get_carved_timestamp(self, file_name):
         """Get the preserved timestamp for a carved file."""
-        for file_info in self.carved_files:
-            if file_info[0] == file_name:
-                return file_info[4]  # Modification date at index 4
-        return None
+        carved_file = self.carved_files.get(file_name)
+        if carved_file is None or carved_file.modification_date is None:
+            return None
+        return format_carved_timestamp(carved_file.modification_date)
 
     def on_carved_file_clicked(self, *args):
         """Handle click on carved file to display in internal viewer.
@@ -429,457 +1128,140 @@ class FileCarvingWidget(QWidget):
         else:
             return
 
-        # Find file info in carved_files list
-        for file_info in self.carved_files:
-            if file_info[0] == file_name:
-                file_size_str = file_info[1]  # Size at index 1
-                file_type = file_info[2]  # Type at index 2
-                file_size = int(file_size_str)
-
-                try:
-                    # Extract disk offset from filename (hex format without extension)
-                    offset_hex = os.path.splitext(file_name)[0]
-                    offset = int(offset_hex, 16)
-
-                    # Read file content directly from disk image (forensically sound!)
-                    if not self.image_handler:
-                        print("No image handler available")
-                        return
-
-                    file_content = self.image_handler.read(offset, file_size)
-                    if not file_content:
-                        print(f"Unable to read content from offset {hex(offset)}")
-                        return
-
-                    # Create data dict for viewer (matches mainwindow's format)
-                    data = {
-                        'name': file_name,
-                        'size': file_size,
-                        'type': file_type,
-                        'offset': offset,
-                        'is_carved': True,  # Flag indicating this is a carved file
-                        'source': 'carved_file',
-                        'file_content': file_content,  # Include content so metadata viewer doesn't re-read
-                        'carved_timestamp': self.get_carved_timestamp(file_name)  # Get original timestamp if available
-                    }
-
-                    # Get MainWindow and call update_viewer_with_file_content
-                    if self.main_window and hasattr(self.main_window, 'update_viewer_with_file_content'):
-                        self.main_window.update_viewer_with_file_content(file_content, data)
-                    else:
-                        print("MainWindow not found or missing update_viewer_with_file_content method")
-
-                except Exception as e:
-                    print(f"Error opening carved file in viewer: {e}")
-                    import traceback
-                    traceback.print_exc()
-
-                break
-
-    def setup_buttons(self):
-        self.start_button.setEnabled(False)
-        self.start_button.clicked.connect(self.start_carving_thread)
-        self.stop_button.setEnabled(False)
-        self.stop_button.clicked.connect(self.stop_carving_thread)
-
-    def start_carving_thread(self):
-        self.start_button.setEnabled(False)
-        self.stop_button.setEnabled(True)
-        # Launch carving in a background thread
-        self.executor.submit(self.carve_files)
-
-    def stop_carving_thread(self):
-        self.executor.shutdown(wait=False)
-        self.start_button.setEnabled(True)
-        self.stop_button.setEnabled(False)
+        # Find file info in carved_files
+        carved_file = self.carved_files.get(file_name)
+        if not carved_file:
+            return
+        file_type = carved_file.file_type
+        file_size = carved_file.size
 
-    def is_valid_file(self, data, file_type):
         try:
-            if file_type == 'pdf':
-                # Validate PDF by trying to read it with PyPDF2
-                PdfReader(io.BytesIO(data))
-            elif file_type in ['jpg', 'jpeg', 'png', 'gif']:
-                # Validate images by attempting to open them with PIL
-                image = Image.open(io.BytesIO(data))
-                image.verify()  # This will not load the image but only parse it
-            elif file_type == 'bmp':
-                return True
-            elif file_type == 'wav':
-                # Basic WAV validation could check for the RIFF header, file size, etc.
-                if not data.startswith(b'RIFF') or not b'WAVE' in data[:12]:
-                    return False
-                # Additional WAV format checks could be implemented here
-            elif file_type == 'mov':
-                return True  # For now, we'll assume all MOV files are valid
-            else:
-                return True
-            return True
-        except (IOError, UnidentifiedImageError, PdfReadError, ValueError) as e:
-            print(f"Error validating file of type {file_type}: {str(e)}")
-            return False
-
-    def carve_pdf_files(self, chunk, global_offset):
-        pdf_start_signature = b'%PDF-'
-        pdf_linearization_signature = b'/Linearized'
-        pdf_end_signature = b'%%EOF'
-        offset = 0
-        while offset < len(chunk):
-            start_index = chunk.find(pdf_start_signature, offset)
-            if start_index == -1:
-                break
-            linearization_index = chunk.find(pdf_linearization_signature, start_index, start_index + 1024)
-            if linearization_index != -1:
-                file_size_start = chunk.find(b'/L ', linearization_index, linearization_index + 1024) + 3
-                file_size_end = chunk.find(b'/', file_size_start)
-                if file_size_end == -1:
-                    file_size_end = chunk.find(b' ', file_size_start)
-                if file_size_end != -1:
-                    try:
-                        file_size = int(chunk[file_size_start:file_size_end].split()[0])
-                        pdf_content = chunk[start_index:start_index + file_size]
-                        if self.is_valid_file(pdf_content, 'pdf'):
-                            self.save_file(pdf_content, 'pdf', global_offset + start_index, file_size)
-                            offset = start_index + file_size
-                            continue
-                    except ValueError:
-                        pass
-            end_index = chunk.find(pdf_end_signature, start_index)
-            if end_index != -1:
-                end_index += len(pdf_end_signature)
-                pdf_content = chunk[start_index:end_index]
-                if self.is_valid_file(pdf_content, 'pdf'):
-                    self.save_file(pdf_content, 'pdf', global_offset + start_index, end_index - start_index)
-                offset = end_index
-            else:
-                offset = start_index + 1
-
-    def carve_wav_files(self, chunk, offset):
-        wav_start_signature = b'RIFF'
-        offset = 0
-        while offset < len(chunk):
-            start_index = chunk.find(wav_start_signature, offset)
-            if start_index == -1:
-                break
-
-            if chunk[start_index + 8:start_index + 12] != b'WAVE':
-                offset = start_index + 4
-                continue
-
-            file_size_bytes = chunk[start_index + 4:start_index + 8]
-            file_size = int.from_bytes(file_size_bytes, byteorder='little') + 8
-
-            if start_index + file_size > len(chunk):
-                wav_content = chunk[start_index:]
-                offset = len(chunk)
-            else:
-                wav_content = chunk[start_index:start_index + file_size]
-                offset = start_index + file_size
-
-            if self.is_valid_file(wav_content, 'wav'):
-                self.save_file(wav_content, 'wav', 'carved_files', start_index)
-
-    def carve_mov_files(self, chunk, offset):
-        mov_signatures = [
-            # b'ftyp', b'moov', b'mdat', #b'pnot', b'udta', #b'uuid',
-            # b'moof', b'free', b'skip', b'jP2 ', b'wide', b'load',
-            # b'ctab', b'imap', b'matt', b'kmat', b'clip', b'crgn',
-            # b'sync', b'chap', b'tmcd', b'scpt', b'ssrc', b'PICT'
-            b'moov', b'mdat', b'free', b'wide'
-        ]
-
-        mov_file_found = False
-        mov_data = b''
-        mov_file_offset = offset
-        mov_file_size = 0
-
-        while offset < len(chunk):
-            if offset + 8 > len(chunk):
-                # Not enough data for an atom header
-                break
-
-            atom_size = int.from_bytes(chunk[offset:offset + 4], 'big')
-            atom_type = chunk[offset + 4:offset + 8]
-
-            if atom_type not in mov_signatures:
-                if mov_file_found:
-                    # End of MOV file
-                    break
-                else:
-                    # Not a MOV file or just a stray header, skip ahead
-                    offset += 4
-                    continue
+            # Extract disk offset from filename (hex format without extension)
+            offset_hex = os.path.splitext(file_name)[0]
+            offset = int(offset_hex, 16)
 
-            mov_file_found = True
-            mov_file_size += atom_size
+            # Read file content directly from disk image (forensically sound!)
+            if not self.image_handler:
+                print("No image handler available")
+                return
 
-            if offset + atom_size > len(chunk):
-                # Atom extends beyond this chunk, store what we have and wait for more data
-                mov_data += chunk[offset:]
-                break
-            else:
-                # We have the whole atom, store it
-                mov_data += chunk[offset:offset + atom_size]
-
-            offset += atom_size
-
-        if mov_file_found and mov_data:
-            # file_name = f"carved_{mov_file_offset}.mov"
-            # file_path = os.path.join("carved_files", file_name)
-            # self.save_file(mov_data, 'mov', file_path)
-            self.save_file(mov_data, 'mov', 'carved_files', mov_file_offset)
-
-    def carve_jpg_files(self, chunk, offset):
-        jpg_start_signature = b'\xFF\xD8\xFF'
-        jpg_end_signature = b'\xFF\xD9'
-        offset = 0
-        while offset < len(chunk):
-            start_index = chunk.find(jpg_start_signature, offset)
-            if start_index == -1:
-                break
-
-            end_index = chunk.find(jpg_end_signature, start_index)
-            if end_index != -1:
-                jpg_content = chunk[start_index:end_index + len(jpg_end_signature)]
-
-                # Check if it's a valid JPG file
-                if self.is_valid_file(jpg_content, 'jpg'):
-                    self.save_file(jpg_content, 'jpg', 'carved_files', start_index)
-
-                offset = end_index + len(jpg_end_signature)
-            else:
-                offset = start_index + 1  # Continue searching
-
-    def carve_gif_files(self, chunk, offset):
-        gif_start_signature = b'\x47\x49\x46\x38'
-        gif_end_signature = b'\x00\x3B'
-        offset = 0
-        while offset < len(chunk):
-            start_index = chunk.find(gif_start_signature, offset)
-            if start_index == -1:
-                break
-
-            end_index = chunk.find(gif_end_signature, start_index)
-            if end_index != -1:
-                gif_content = chunk[start_index:end_index + len(gif_end_signature)]
-
-                # Check if it's a valid GIF file
-                if self.is_valid_file(gif_content, 'gif'):
-                    self.save_file(gif_content, 'gif', 'carved_files', start_index)
-
-                offset = end_index + len(gif_end_signature)
-            else:
-                offset = start_index + 1
-
-    def carve_png_files(self, chunk, offset):
-        png_start_signature = b'\x89\x50\x4E\x47\x0D\x0A\x1A\x0A'
-        png_end_signature = b'\x49\x45\x4E\x44\xAE\x42\x60\x82'
-        offset = 0
-        while offset < len(chunk):
-            start_index = chunk.find(png_start_signature, offset)
-            if start_index == -1:
-                break
-
-            end_index = chunk.find(png_end_signature, start_index)
-            if end_index != -1:
-                png_content = chunk[start_index:end_index + len(png_end_signature)]
-
-                # Check if it's a valid PNG file
-                if self.is_valid_file(png_content, 'png'):
-                    self.save_file(png_content, 'png', 'carved_files', start_index)
-
-                offset = end_index + len(png_end_signature)
-            else:
-                offset = start_index + 1
-
-    def carve_wmv_files(self, chunk, offset):
-        # Define ASF header signature
-        asf_header_signature = b'\x30\x26\xB2\x75\x8E\x66\xCF\x11\xA6\xD9\x00\xAA\x00\x62\xCE\x6C'
-
-        current_offset = 0
-
-        while current_offset < len(chunk):
-            # Search for ASF header
-            start_index = chunk.find(asf_header_signature, current_offset)
-            if start_index == -1:
-                break
-
-            # Find the file properties object header within the first 512 bytes of the file
-            max_search_size = min(start_index + 512, len(chunk))
-            file_properties_header = b'\xA1\xDC\xAB\x8C\x47\xA9\xCF\x11\x8E\xE4\x00\xC0\x0C\x20\x53\x65'
-            file_properties_index = chunk.find(file_properties_header, start_index, max_search_size)
-            if file_properties_index == -1:
-                current_offset = start_index + 1
-                continue
-
-            # Extract the file size located at offset 40 within the object
-            file_size_offset = file_properties_index + 40
-            file_size_bytes = chunk[file_size_offset:file_size_offset + 8]
-            file_size = int.from_bytes(file_size_bytes, byteorder='little')
-
-            # Calculate end index based on file size
-            end_index = start_index + file_size
-
-            # Extract WMV content
-            wmv_content = chunk[start_index:end_index]
-
-            # Save the WMV content directly into the carved_files directory
-            self.save_file(wmv_content, 'wmv', 'carved_files', start_index + offset)
-            current_offset = end_index
-
-    def carve_zip_files(self, chunk, global_offset):
-        # Define ZIP header signatures
-        local_file_header_signature = b'\x50\x4b\x03\x04'
-        end_of_central_dir_signature = b'\x50\x4b\x05\x06'
-
-        current_pos = 0
-        zip_file_parts = []  # List to hold all parts of the ZIP file
-
-        while current_pos < len(chunk):
-            # Search for local file header
-            local_header_index = chunk.find(local_file_header_signature, current_pos)
-            if local_header_index == -1:
-                break
-
-            # Extract compressed size from local file header
-            compressed_size = struct.unpack("<I", chunk[local_header_index + 18:local_header_index + 22])[0]
-
-            # Calculate next local file header index
-            next_local_header_index = local_header_index + 30 + compressed_size
-
-            # Extract file content
-            file_content = chunk[local_header_index:next_local_header_index]
-            zip_file_parts.append(file_content)  # Add the file content to the ZIP parts list
-
-            # Move to next local file header
-            current_pos = next_local_header_index
-
-        # Now, find and append the Central Directory and End of Central Directory Record
-        end_central_dir_index = chunk.find(end_of_central_dir_signature, current_pos)
-        if end_central_dir_index != -1:
-            # Extract comment length and calculate the total end of the ZIP file structure
-            comment_length = struct.unpack("<H", chunk[end_central_dir_index + 20:end_central_dir_index + 22])[0]
-            zip_end = end_central_dir_index + 22 + comment_length
-
-            # Extract the Central Directory and End of Central Directory Record
-            zip_file_structure = chunk[current_pos:zip_end]
-            zip_file_parts.append(zip_file_structure)  # Add this to the ZIP parts list
-
-        # Combine all parts into a single ZIP file content
-        if zip_file_parts:
-            complete_zip_file_content = b''.join(zip_file_parts)
-            self.save_file(complete_zip_file_content, 'zip', 'carved_files', global_offset)
+            file_content = self.image_handler.read(offset, file_size)
+            if not file_content:
+                print(f"Unable to read content from offset {hex(offset)}")
+                return
 
-        return None
+            # Create data dict for viewer (matches mainwindow's format)
+            data = {
+                'name': file_name,
+                'size': file_size,
+                'type': file_type,
+                'offset': offset,
+                'is_carved': True,  # Flag indicating this is a carved file
+                'source': 'carved_file',
+                'file_content': file_content,  # Include content so metadata viewer doesn't re-read
+                'carved_timestamp': self.get_carved_timestamp(file_name)  # Get original timestamp if available
+            }
 
-    def carve_bmp_files(self, chunk, offset):
-        bmp_start_signature = b'BM'  # BMP files start with 'BM'
-        header_size = 14  # The static header size for BMP files
-
-        current_offset = 0
-        while current_offset < len(chunk) - header_size:
-            # Look for the BMP signature
-            start_index = chunk.find(bmp_start_signature, current_offset)
-            if start_index == -1:
-                break  # No more BMP files found
-
-            # Verify there's enough chunk left to read the BMP size
-            if start_index + header_size > len(chunk) - 4:
-                break  # Not enough data for size
-
-            # Read file size directly from header
-            bmp_file_size = int.from_bytes(chunk[start_index + 2:start_index + 6], byteorder='little')
-
-            # Sanity check for BMP size (adjust max and min size as per your need)
-            if bmp_file_size < 100 or bmp_file_size > 5000000:
-                current_offset = start_index + 2
-                continue  # Not a valid BMP size, skip to next possible start
-
-            # Read and check dimensions for further validation
-            bmp_width = int.from_bytes(chunk[start_index + 18:start_index + 22], byteorder='little')
-            bmp_height = int.from_bytes(chunk[start_index + 22:start_index + 26], byteorder='little')
-
-            # Reasonable dimensions check (adjust max width/height as per your need)
-            if bmp_width <= 0 or bmp_width > 10000 or bmp_height <= 0 or bmp_height > 10000:
-                current_offset = start_index + 2
-                continue  # Unreasonable dimensions, likely not a BMP
-
-            # Extract the BMP file if it's entirely within the chunk
-            if start_index + bmp_file_size <= len(chunk):
-                bmp_content = chunk[start_index:start_index + bmp_file_size]
-                self.save_file(bmp_content, 'bmp', 'carved_files', start_index + offset)
-                current_offset = start_index + bmp_file_size  # Move past this BMP file
+            # Get MainWindow and call update_viewer_with_file_content
+            if self.main_window and hasattr(self.main_window, 'update_viewer_with_file_content'):
+                self.main_window.update_viewer_with_file_content(file_content, data)
             else:
-                break  # The BMP file exceeds the chunk boundary, stop processing
+                print("MainWindow not found or missing update_viewer_with_file_content method")
 
-        # Return if more data is needed or if processing is complete
-        return None
+        except Exception as e:
+            print(f"Error opening carved file in viewer: {e}")
+            import traceback
+            traceback.print_exc()
 
     def carve_files(self, selected_file_types):
-        try:
-            self.stop_carving = False
-            chunk_size = 1024 * 1024 * 100
-            offset = 0
-            chunks_processed = 0
-            chunks_skipped = 0
-
-            while offset < self.image_handler.get_size():
-                # Check if this chunk overlaps with allocated space
-                if self.is_offset_allocated(offset, chunk_size, self.allocation_map):
-                    # Skip this chunk - it's in allocated space (existing files)
-                    chunks_skipped += 1
-                    offset += chunk_size
-                    continue
+        """Carve the image chunk by chunk in a pool of processes; runs on a CarvingWorker thread."""
+        chunk_size = CARVING_CHUNK_SIZE
+        chunks_processed = 0
 
-                chunks_processed += 1
+        # Resolve the selected carvers once; 'All' stands for every carver and also avoids carving a type twice
+        if 'all' in selected_file_types:
+            selected_carvers = CARVERS
+        else:
+            selected_carvers = {file_type: CARVERS[file_type] for file_type in selected_file_types
+                                if file_type in CARVERS}
+        resume_offsets = dict.fromkeys(selected_carvers, 0)  # Image offset from which each type resumes
+
+        # Skip chunks that overlap allocated space (existing files) up front, so the next chunk is known in advance
+        image_size = self.image_handler.get_size()
+        all_offsets = range(0, image_size, chunk_size)
+        unallocated_offsets = [offset for offset in all_offsets
+                               if not self.is_offset_allocated(offset, chunk_size, self.allocation_map)]
+        chunks_skipped = len(all_offsets) - len(unallocated_offsets)
+        chunk_offsets = iter(unallocated_offsets)
+
+        # Raw images are memory-mapped by each carving process; other images are read here into shared memory.
+        # The handler is kept for the whole carve, as a new image may be opened while an interrupted carve stops.
+        image_handler = self.image_handler
+        mapped = image_handler.mmap() is not None
+        image_path = image_handler.image_path
+
+        # Chunks in flight as (future, shared memory or None), oldest first. The carving thread reads
+        # the next chunk while the processes carve, and at most CARVING_PROCESSES chunks are held at once.
+        in_flight = deque()
+
+        def submit_next_chunk(pool):
+            offset = next(chunk_offsets, None)
+            if offset is None:
+                return False
+            if mapped:
+                in_flight.append((pool.submit(carve_mapped_chunk, image_path, offset, chunk_size,
+                                              selected_carvers), None))
+                return True
+            chunk = image_handler.read(offset, chunk_size + CARVING_OVERLAP_SIZE)
+            if not chunk:
+                return False
+            shared_chunk = shared_memory.SharedMemory(create=True, size=len(chunk))
+            shared_chunk.buf[:len(chunk)] = chunk
+            in_flight.append((pool.submit(carve_shared_chunk, shared_chunk.name, offset, len(chunk), chunk_size,
+                                          selected_carvers), shared_chunk))
+            return True
 
-                chunk = self.image_handler.read(offset, chunk_size)
-                if not chunk:
-                    break
+        # Spawned rather than forked: forking this multithreaded process can deadlock the children
+        pool = ProcessPoolExecutor(max_workers=CARVING_PROCESSES, mp_context=multiprocessing.get_context('spawn'))
+        try:
+            while len(in_flight) < CARVING_PROCESSES and submit_next_chunk(pool):
+                pass
 
-                if self.stop_carving:
-                    self.stop_carving = False
-                    self.start_button.setEnabled(True)
-                    self.stop_button.setEnabled(False)
+            # Results are taken in chunk order, so skipping files inside one already carved works across chunks
+            while in_flight:
+                if QThread.currentThread().isInterruptionRequested():
                     print(f"Carving stopped. Processed {chunks_processed} unallocated chunks, skipped {chunks_skipped} allocated chunks")
                     return
 
-                # Call the carve function for each selected file type
-                for file_type in selected_file_types:
-                    if file_type == 'all':
-                        self.carve_wav_files(chunk, offset)
-                        self.carve_mov_files(chunk, offset)
-                        self.carve_pdf_files(chunk, offset)
-                        self.carve_jpg_files(chunk, offset)
-                        self.carve_gif_files(chunk, offset)
-                        self.carve_png_files(chunk, offset)
-                        self.carve_wmv_files(chunk, offset)
-                        self.carve_zip_files(chunk, offset)
-                        self.carve_bmp_files(chunk, offset)
-                    elif file_type == 'wav':
-                        self.carve_wav_files(chunk, offset)
-                    elif file_type == 'mov':
-                        self.carve_mov_files(chunk, offset)
-                    elif file_type == 'pdf':
-                        self.carve_pdf_files(chunk, offset)
-                    elif file_type == 'jpg':
-                        self.carve_jpg_files(chunk, offset)
-                    elif file_type == 'gif':
-                        self.carve_gif_files(chunk, offset)
-                    elif file_type == 'png':
-                        self.carve_png_files(chunk, offset)
-                    elif file_type == 'wmv':
-                        self.carve_wmv_files(chunk, offset)
-                    elif file_type == 'zip':
-                        self.carve_zip_files(chunk, offset)
-                    elif file_type == 'bmp':
-                        self.carve_bmp_files(chunk, offset)
-
-                offset += chunk_size
-
-            print(f"Carving complete. Processed {chunks_processed} unallocated chunks, skipped {chunks_skipped} allocated chunks")
+                future, shared_chunk = in_flight[0]
+                if not wait([future], timeout=CARVING_POLL_INTERVAL).done:
+                    continue  # Still carving; check for a stop request again
+                in_flight.popleft()
+                carved = future.result()
+                if shared_chunk is not None:
+                    shared_chunk.close()
+                    shared_chunk.unlink()
+                chunks_processed += 1
+                submit_next_chunk(pool)
+
+                for file_type, file_offset, resume_offset, content in carved:
+                    if file_offset >= resume_offsets[file_type]:
+                        resume_offsets[file_type] = resume_offset
+                        self.save_file(content, file_type, file_offset)
         finally:
-            self.start_button.setEnabled(True)
-            self.stop_button.setEnabled(False)
+            for future, _ in in_flight:
+                future.cancel()
+            # Chunks already being carved are not waited for; their results are no longer needed
+            pool.shutdown(wait=False, cancel_futures=True)
+            for _, shared_chunk in in_flight:
+                if shared_chunk is not None:
+                    shared_chunk.close()
+                    shared_chunk.unlink()
+            # Carving is only finished once every carved file is on disk and queued for display
+            wait(self.pending_writes)
+            self.pending_writes.clear()
+
+        print(f"Carving complete. Processed {chunks_processed} unallocated chunks, skipped {chunks_skipped} allocated chunks")
 
     @staticmethod
     def extract_original_timestamp(file_content, file_type):
@@ -933,42 +1315,104 @@ class FileCarvingWidget(QWidget):
 
         return None
 
-    def save_file(self, file_content, file_type, file_path, offset):
-        # Ensure the 'carved_files' directory exists
-        if not os.path.exists("carved_files"):
-            os.makedirs("carved_files")
+    @staticmethod
+    def write_file(file_path, file_content):
+        """Write bytes with raw os.open/os.write, skipping the buffered file object."""
+        fd = os.open(file_path, CARVED_FILE_FLAGS, 0o644)
+        try:
+            view = memoryview(file_content)
+            while view:
+                # os.write may write less than requested for very large buffers
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
 
+    def save_file(self, file_content, file_type, offset):
         offset_hex = format(offset, 'x')
         file_name = f"{offset_hex}.{file_type}"
-        file_path = os.path.join("carved_files", file_name)
+        file_path = CARVED_FILES_PREFIX + file_name
+        if file_name in self.carved_files:
+            return
+        carved_file = CarvedFile(len(file_content), file_type, file_path)
+        self.carved_files[file_name] = carved_file
+
+        # Wait for the oldest write once the backlog is full, so a slow disk throttles carving
+        if len(self.pending_writes) >= CARVED_FILE_WRITE_BACKLOG:
+            self.pending_writes.popleft().result()
+        self.pending_writes.append(
+            self.writer_pool.submit(self.store_carved_file, file_content, file_name, carved_file))
+
+    def store_carved_file(self, file_content, file_name, carved_file):
+        """Write a carved file and queue its row; runs on a writer thread."""
+        file_type = carved_file.file_type
+        file_path = carved_file.path
 
         # Write file content to disk
-        with open(file_path, "wb") as f:
-            f.write(file_content)
+        try:
+            self.write_file(file_path, file_content)
+        except OSError as e:
+            print(f"Error writing carved file {file_path}: {e}")
+            self.carved_files.pop(file_name, None)
+            return
 
         # Try to extract original timestamp from file metadata
         original_timestamp = self.extract_original_timestamp(file_content, file_type)
 
+        modification_date = None
         if original_timestamp:
             # Convert datetime to timestamp (seconds since epoch)
-            timestamp = time.mktime(original_timestamp.timetuple())
-            # Set both access time and modification time to preserve original timestamp
-            os.utime(file_path, (timestamp, timestamp))
-            modification_date = original_timestamp.strftime("%Y-%m-%d %H:%M:%S")
-        else:
-            # Fall back to carving time if no original timestamp found
-            modification_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        file_size = str(len(file_content))
-        self.carved_files.append((file_name, file_size, file_type, file_path, modification_date))
-        self.file_carved.emit(file_name, file_size, file_type, modification_date, file_path)
-        self.carved_file_names.add(file_name)
+            original_date = time.mktime(original_timestamp.timetuple())
+            try:
+                # Set both access time and modification time to preserve original timestamp
+                os.utime(file_path, (original_date, original_date))
+                modification_date = original_date
+            except OSError as e:
+                # The file is written; one file's metadata is no reason to stop the carve
+                print(f"Error setting timestamp of carved file {file_path}: {e}")
+        if modification_date is None:
+            # Fall back to carving time if no original timestamp found or it could not be set
+            modification_date = time.time()
+
+        carved_file.modification_date = modification_date
+        if file_type in THUMBNAIL_MAKERS:
+            carved_file.thumbnail_key = thumbnail_cache_key(file_content)
+        self.pending_carved_files.append((file_name, str(carved_file.size), file_type, modification_date, file_path))
+
+    def flush_carved_files(self):
+        """Emit everything queued since the last tick as a single batch."""
+        # Read the state first: once the worker has finished no more rows can be queued behind this drain
+        finished = not (self.carving_worker and self.carving_worker.isRunning())
+
+        batch = []
+        while self.pending_carved_files:
+            batch.append(self.pending_carved_files.popleft())
+        if batch:
+            self.files_carved.emit(batch)
+
+        if finished:
+            self.batch_timer.stop()
+
+    @Slot(list)
+    def display_carved_files(self, batch):
+        """Insert a batch of carved files with repaints and sorting suspended."""
+        self.table_widget.setUpdatesEnabled(False)
+        self.list_widget.setUpdatesEnabled(False)
+        # Sorting would reorder rows while display_carved_file is still filling them in
+        self.table_widget.setSortingEnabled(False)
+        try:
+            # Grow the table once for the whole batch rather than inserting rows one by one
+            first_row = self.table_widget.rowCount()
+            self.table_widget.setRowCount(first_row + len(batch))
+            for row, (name, size, type_, modification_date, file_path) in enumerate(batch, first_row):
+                self.display_carved_file(row, name, size, type_, modification_date, file_path)
+        finally:
+            self.table_widget.setSortingEnabled(True)
+            self.table_widget.setUpdatesEnabled(True)
+            self.list_widget.setUpdatesEnabled(True)
 
-    @Slot(str, str, str, str, str)
-    def display_carved_file(self, name, size, type_, modification_date, file_path):
-        row = self.table_widget.rowCount()
+    def display_carved_file(self, row, name, size, type_, modification_date, file_path):
         readable_size = self.image_handler.get_readable_size(int(size))
-        self.table_widget.insertRow(row)
 
         # Get file icon based on type/extension
         extension = type_.lower() if type_ else 'unknown'
@@ -983,43 +1427,31 @@ class FileCarvingWidget(QWidget):
         self.table_widget.setItem(row, 1, name_item)
 
         # Set other columns
-        self.table_widget.setItem(row, 2, NumericTableWidgetItem(readable_size))
+        self.table_widget.setItem(row, 2, NumericTableWidgetItem(readable_size, int(size)))
         self.table_widget.setItem(row, 3, QTableWidgetItem(type_))
-        self.table_widget.setItem(row, 4, QTableWidgetItem(modification_date))
+        self.table_widget.setItem(row, 4, QTableWidgetItem(format_carved_timestamp(modification_date)))
         self.table_widget.setItem(row, 5, QTableWidgetItem(file_path))
 
         # Only proceed if the file type is one of the supported formats
-        if type_.lower() in ['jpg', 'jpeg', 'png', 'gif', 'mov', 'pdf', 'wmv', 'bmp', 'zip', 'wav']:
+        if type_.lower() in ['jpg', 'png', 'gif', 'mov', 'pdf', 'wmv', 'bmp', 'zip', 'wav']:
             file_full_path = os.path.join("carved_files", name)
-            thumbnail_folder = os.path.join("carved_files", "thumbnails")  # Folder to save thumbnails
-
-            if not os.path.exists(thumbnail_folder):
-                os.makedirs(thumbnail_folder)  # Create the thumbnail folder if it doesn't exist
-
-            if type_.lower() == 'mov':
-                thumbnail_path = os.path.join(thumbnail_folder, name.replace('.mov', '.png'))
-                with VideoFileClip(file_full_path) as clip:
-                    clip.save_frame(thumbnail_path, t=0.5)  # save frame at 0.5 seconds
-                pixmap = QPixmap(thumbnail_path)
-
-            elif type_.lower() == 'pdf':
-                # Convert the first page of the PDF to a thumbnail
-                images = convert_from_path(file_full_path)
-                thumbnail_path = os.path.join(thumbnail_folder, name.replace('.pdf', '.png'))
-                images[0].save(thumbnail_path, 'PNG')
-                # Create the QPixmap from the full path
-                pixmap = QPixmap(thumbnail_path)
-
-            elif type_.lower() == 'wmv':
-                capture = cv2.VideoCapture(file_full_path)
-                success, image = capture.read()
-                capture.release()  # Release the capture object explicitly
-                if success:
-                    thumbnail_path = os.path.join(thumbnail_folder, name.replace('.wmv', '.png'))
-                    cv2.imwrite(thumbnail_path, image)
-                    pixmap = QPixmap(thumbnail_path)
+
+            # Thumbnails are made in a thumbnail process and cached on disk as THUMBNAIL_CACHE_DIR/<key>.png,
+            # keyed by a hash of the carved file, so later runs load them instead of decoding again
+            thumbnail_maker = THUMBNAIL_MAKERS.get(type_.lower())
+            thumbnail_path = None
+            if thumbnail_maker:
+                carved_file = self.carved_files.get(name)
+                thumbnail_file = carved_file.thumbnail_key + '.png' if carved_file and carved_file.thumbnail_key else None
+                if thumbnail_file:
+                    thumbnail_path = os.path.join(THUMBNAIL_CACHE_DIR, thumbnail_file)
+                if thumbnail_file in self.cached_thumbnails:
+                    # Made for the same file in an earlier run
+                    pixmap = self.load_scaled_pixmap(thumbnail_path, 120)
+                    thumbnail_maker = None
                 else:
-                    print("Failed to extract thumbnail from WMV file")
+                    # Decoded in a thumbnail process; the file type icon stands in until it is ready
+                    pixmap = None
 
             elif type_.lower() == 'zip':
                 # Render ZIP icon at target size for crisp display
@@ -1029,15 +1461,13 @@ class FileCarvingWidget(QWidget):
                 # Render audio icon at target size for crisp display
                 pixmap = self.render_svg_to_pixmap('Icons/mimetypes/audio-x-generic.svg', 120)
 
+            if pixmap is None:
+                icon = QIcon(icon_path)
             else:
-                # For image files, use the original file path
-                thumbnail_path = file_full_path
-                pixmap = QPixmap(thumbnail_path)
-
-            # Center-crop to perfect square for modern uniform gallery look (skip for SVG icons)
-            if type_.lower() not in ['zip', 'wav']:
-                pixmap = self.center_crop_to_square(pixmap, 120)
-            icon = QIcon(pixmap)
+                # Center-crop to perfect square for modern uniform gallery look (skip for SVG icons)
+                if type_.lower() not in ['zip', 'wav']:
+                    pixmap = self.center_crop_to_square(pixmap, 120)
+                icon = QIcon(pixmap)
 
             # Create a QListWidgetItem, set its icon, and provide a size hint to ensure the text is visible
             item = QListWidgetItem(icon, name)
@@ -1050,18 +1480,76 @@ class FileCarvingWidget(QWidget):
             # Add the QListWidgetItem to the list widget
             self.list_widget.addItem(item)
 
+            if thumbnail_maker:
+                self.thumbnail_items[name] = item
+                if thumbnail_path:
+                    future = self.thumbnail_pool.submit(make_cached_thumbnail, thumbnail_maker, file_full_path,
+                                                        thumbnail_path)
+                else:
+                    future = self.thumbnail_pool.submit(thumbnail_maker, file_full_path)
+                self.thumbnail_futures[name] = future
+                future.add_done_callback(partial(self.on_thumbnail_made, name))
+
+    def on_thumbnail_made(self, name, future):
+        """Pass a finished thumbnail to the GUI thread; runs on the thumbnail pool's thread."""
+        if not future.cancelled():
+            self.thumbnail_ready.emit(name, future)
+
+    @Slot(str, object)
+    def set_thumbnail(self, name, future):
+        # Thumbnails of items removed by clear() since they were submitted are dropped
+        if self.thumbnail_futures.get(name) is not future:
+            return
+        del self.thumbnail_futures[name]
+        item = self.thumbnail_items.pop(name)
+        try:
+            png = future.result()
+        except Exception as e:
+            print(f"Error creating thumbnail for {name}: {e}")
+            return
+        if png:
+            pixmap = self.center_crop_to_square(self.pixmap_from_bytes(png), 120)
+            item.setIcon(QIcon(pixmap))
+
+    def cancel_thumbnails(self):
+        """Cancel the thumbnails still queued for list items that are being removed."""
+        for future in self.thumbnail_futures.values():
+            future.cancel()
+        self.thumbnail_futures.clear()
+        self.thumbnail_items.clear()
+
+    def shutdown(self):
+        """Stop the thumbnail processes when the application closes."""
+        self.cancel_thumbnails()
+        self.thumbnail_pool.shutdown(wait=False, cancel_futures=True)
+
     def clear(self):
+        # A running carve is only asked to stop: waiting for it here would freeze the UI until its
+        # current chunk and writes are done. on_carving_finished drops whatever it adds meanwhile.
+        carving = self.carving_worker is not None and self.carving_worker.isRunning()
+        if carving:
+            self.carving_worker.requestInterruption()
+            self.clear_when_finished = True
+            self.batch_timer.stop()
+        self.pending_carved_files.clear()
         self.table_widget.setRowCount(0)
         self.list_widget.clear()
+        self.cancel_thumbnails()
         self.carved_files.clear()
-        self.start_button.setEnabled(True)
+        self.start_button.setEnabled(not carving)
         self.stop_button.setEnabled(False)
 
     def clear_ui(self):
         self.table_widget.setRowCount(0)
         self.list_widget.clear()
+        self.cancel_thumbnails()  # Their items were just deleted
 
     def handle_resize_event(self, event):
+        # Column widths only depend on the table width, so height-only resizes keep the current layout
+        if event.size().width() == event.oldSize().width():
+            super(QTableWidget, self.table_widget).resizeEvent(event)
+            return
+
         # Calculate total width of the table
         total_width = self.table_widget.width()
 
@@ -1,98 +1,124 @@
 import os
+import re
 from functools import lru_cache
+from itertools import groupby
+from html import escape
 
-from PySide6.QtCore import Qt, QObject, Signal, QThread, QSize
-from PySide6.QtGui import QAction, QIcon, QFont, QResizeEvent
+from PySide6.QtCore import Qt, QObject, Signal, QRunnable, QThreadPool, QSize, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QAction, QIcon, QFont, QResizeEvent, QColor
 from PySide6.QtWidgets import (QToolBar, QLabel, QMessageBox, QWidget, QVBoxLayout,
-                               QLineEdit, QTableWidget, QHeaderView, QTableWidgetItem, QListWidget,
+                               QLineEdit, QTableView, QHeaderView, QListWidget,
                                QSizePolicy, QFrame, QApplication, QMenu, QAbstractItemView, QFileDialog,
-                               QToolButton, QComboBox, QSplitter)
+                               QToolButton, QComboBox, QSplitter, QCheckBox)
 
+# Maps every byte to itself when printable and to '.' otherwise, for the ASCII column
+ASCII_TABLE = bytes(byte if 32 <= byte <= 126 else ord('.') for byte in range(256))
+BYTE_HEX = [f'{byte:02X}' for byte in range(256)]  # Text of each byte column cell, by byte value
+HEX_QUERY = re.compile(r'(?:[0-9A-Fa-f]{2})+')  # Queries searched as bytes, once spaces are removed
 
-class SearchWorker(QObject):
+
+class SearchSignals(QObject):
+    # QRunnable is not a QObject, so a search's signals live here
     search_finished = Signal(list)
 
-    def __init__(self, hex_viewer_manager, query):
+
+class SearchWorker(QRunnable):
+    def __init__(self, hex_viewer_manager, query, match_case=True):
         super().__init__()
         self.hex_viewer_manager = hex_viewer_manager
         self.query = query
+        self.match_case = match_case
+        self.signals = SearchSignals()
 
     def run(self):
-        matches = self.hex_viewer_manager.search(self.query)
-        self.search_finished.emit(matches)
+        matches = self.hex_viewer_manager.search(self.query, self.match_case)
+        self.signals.search_finished.emit(matches)
 
 
 class HexViewerManager:
     LINES_PER_PAGE = 1024
+    CACHED_PAGES = 8  # Formatted pages kept per file, enough for paging back and forth around the current one
 
-    def __init__(self, hex_content, byte_content):
-        self.hex_content = hex_content
+    def __init__(self, byte_content):
+        # Lines are formatted from the bytes on demand; there is no full-file hex string to keep
         self.byte_content = byte_content
-        self.num_total_pages = (len(hex_content) // 32) // self.LINES_PER_PAGE
-        if (len(hex_content) // 32) % self.LINES_PER_PAGE:
-            self.num_total_pages += 1
+        page_size = self.LINES_PER_PAGE * 16
+        # Counts the partial last line too, so files not ending on a 16-byte boundary show all their bytes.
+        # An empty file still has its one empty page, so page navigation never goes below page 0
+        self.num_total_pages = max(1, (len(byte_content) + page_size - 1) // page_size)
+        # A bounded cache per instance: a class-level cache would keep every page of every file viewed,
+        # and each file's bytes with them through self
+        self.format_hex = lru_cache(maxsize=self.CACHED_PAGES)(self.format_hex)
 
-    @lru_cache(maxsize=None)
     def format_hex(self, page=0):
-        start_index = page * self.LINES_PER_PAGE * 32
-        end_index = start_index + (self.LINES_PER_PAGE * 32)
+        start_offset = page * self.LINES_PER_PAGE * 16
+        end_offset = min(start_offset + self.LINES_PER_PAGE * 16, len(self.byte_content))
         lines = []
-        chunk_starts = range(start_index, end_index, 32)
-        for start in chunk_starts:
-            if start >= len(self.hex_content):
-                break
-            lines.append(self.format_hex_chunk(start))
+        for offset in range(start_offset, end_offset, 16):
+            lines.append(self.format_hex_chunk(offset))
         return '\n'.join(lines)
 
-    def format_hex_chunk(self, start):
-        hex_part = []
-        ascii_repr = []
-        for j in range(start, start + 32, 2):
-            chunk = self.hex_content[j:j + 2]
-            if not chunk:
-                break
-            chunk_int = int(chunk, 16)
-            hex_part.append(chunk.upper())
-            ascii_repr.append(chr(chunk_int) if 32 <= chunk_int <= 126 else '.')
-        hex_line = ' '.join(hex_part)
-        padding = ' ' * (48 - len(hex_line))
-        ascii_line = ''.join(ascii_repr)
-        line = f'0x{start // 2:08x}: {hex_line}{padding}  {ascii_line}'
-        return line
+    def format_hex_chunk(self, offset):
+        chunk = self.byte_content[offset:offset + 16]
+        hex_line = chunk.hex(' ').upper()
+        ascii_line = chunk.translate(ASCII_TABLE).decode('ascii')
+        return f'0x{offset:08x}: {hex_line:<48}  {ascii_line}'
+
+    def page_bytes(self, page):
+        """Return the offset of a page's first byte and the page's bytes."""
+        start_offset = page * self.LINES_PER_PAGE * 16
+        return start_offset, self.byte_content[start_offset:start_offset + self.LINES_PER_PAGE * 16]
 
     def total_pages(self):
         return self.num_total_pages
 
-    def search(self, query):
-        if all(part.isalnum() or part.isspace() for part in query.split()):
-            try:
-                query_bytes = bytes.fromhex(query.replace(" ", ""))
-                return self.search_by_hex(query_bytes)
-            except ValueError:
-                pass  # Invalid hex value
-
-        if query.startswith("0x"):
+    def search(self, query, match_case=True):
+        # Addresses are recognised by their prefix alone, before any hex classification
+        if query.startswith(("0x", "0X")):
             return self.search_by_address(query)
-        else:
-            return self.search_by_string(query)
+
+        hex_digits = query.replace(" ", "")
+        if HEX_QUERY.fullmatch(hex_digits):
+            # Only whole hex byte pairs get here, so fromhex cannot fail
+            return self.search_by_hex(bytes.fromhex(hex_digits))
+        return self.search_by_string(query, match_case)
 
     def search_by_address(self, address):
         """Searches for the line that contains the given address (offset)"""
         try:
             address_int = int(address, 16)
             line_number = address_int // 16
-            if 0 <= line_number < len(self.byte_content) // 16:
+            if 0 <= line_number < (len(self.byte_content) + 15) // 16:  # The last line may be partial
                 return [line_number]
             else:
                 return []
         except ValueError:
             return []
 
-    def search_by_string(self, query):
+    @staticmethod
+    def can_overlap(query_bytes):
+        """Whether two matches of query_bytes can overlap, i.e. some proper prefix of it is also a suffix."""
+        return any(query_bytes[:size] == query_bytes[-size:] for size in range(1, len(query_bytes)))
+
+    def search_by_string(self, query, match_case=True):
         # Implementation for searching by string
         matches = []
         query_bytes = query.encode('utf-8')
 
+        if not match_case:
+            # re folds only ASCII letters for bytes patterns. Overlapping matches need a lookahead,
+            # which matches without consuming anything
+            pattern = re.escape(query_bytes)
+            if self.can_overlap(query_bytes.lower()):
+                pattern = b'(?=' + pattern + b')'
+            pattern = re.compile(pattern, re.IGNORECASE)
+            return [match.start() // 16 for match in pattern.finditer(self.byte_content)]
+
+        if not self.can_overlap(query_bytes):
+            # Matches can't overlap, so the non-overlapping regex scan in search_by_hex finds every one
+            return self.search_by_hex(query_bytes)
+
+        # Otherwise step one byte past each match so overlapping matches are found too
         start = 0
         while start < len(self.byte_content):
             position = self.byte_content.find(query_bytes, start)
@@ -104,26 +130,74 @@ class HexViewerManager:
 
         return matches
 
-    def search_by_hex(self, hex_query):
-        if all(part.isalnum() for part in hex_query.split()):
-            try:
-                query_bytes = bytes.fromhex(hex_query.replace(" ", ""))
-            except ValueError:
-                return []  # Invalid hex value
-        else:
-            return []  # Non-alphanumeric characters in the query
+    def search_by_hex(self, query_bytes):
+        # search() has already decoded the hex query. Matches do not overlap, so the C regex scanner can
+        # walk them all; re.escape keeps every byte literal
+        if not query_bytes:
+            return []  # An empty query would match at every offset
+        pattern = re.compile(re.escape(query_bytes))
+        return [match.start() // 16 for match in pattern.finditer(self.byte_content)]
 
-        matches = []
-        start = 0
-        while start < len(self.byte_content):
-            position = self.byte_content[start:].find(query_bytes)
-            if position == -1:
-                break
-            start += position  # Adjust the start to the found position
-            line_number = start // 16  # Calculate line number
-            matches.append(line_number)
-            start += len(query_bytes)  # Move past the current match
-        return matches
+
+class HexTableModel(QAbstractTableModel):
+    """One page of the hex view, formatted cell by cell as the view asks for it.
+
+    The view only requests the rows it shows, so turning a page no longer creates a table item for each
+    of its 18 000 or so cells.
+    """
+    HEADER_LABELS = ['Address'] + [f'{i:02X}' for i in range(16)] + ['ASCII']
+    HIGHLIGHT_COLOR = QColor(Qt.yellow)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.page_bytes = b''
+        self.page_offset = 0  # Offset of the page's first byte in the file
+        self.highlighted_row = None  # Row whose byte cells are highlighted, e.g. a search result
+
+    def set_page(self, page_offset, page_bytes):
+        self.beginResetModel()
+        self.page_offset = page_offset
+        self.page_bytes = page_bytes
+        self.highlighted_row = None
+        self.endResetModel()
+
+    def highlight_row(self, row):
+        previous_row = self.highlighted_row
+        self.highlighted_row = row
+        # Only the byte cells of the old and new rows need repainting
+        if previous_row is not None:
+            self.dataChanged.emit(self.index(previous_row, 1), self.index(previous_row, 16), [Qt.BackgroundRole])
+        self.dataChanged.emit(self.index(row, 1), self.index(row, 16), [Qt.BackgroundRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else (len(self.page_bytes) + 15) // 16
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADER_LABELS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        row = index.row()
+        column = index.column()
+        if role == Qt.DisplayRole:
+            line_offset = row * 16
+            if column == 0:
+                return f'0x{self.page_offset + line_offset:08x}:'
+            if column == 17:
+                return self.page_bytes[line_offset:line_offset + 16].translate(ASCII_TABLE).decode('ascii')
+            position = line_offset + column - 1
+            if position < len(self.page_bytes):  # The file's last line may be short
+                return BYTE_HEX[self.page_bytes[position]]
+        elif role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        elif role == Qt.BackgroundRole:
+            if row == self.highlighted_row and 1 <= column <= 16:
+                return self.HIGHLIGHT_COLOR
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADER_LABELS[section]
+        return None
 
 
 class HexViewer(QWidget):
@@ -131,6 +205,8 @@ class HexViewer(QWidget):
         super().__init__(parent)
         self.hex_viewer_manager = None
         self.current_page = 0
+        self.search_pool = QThreadPool(self)  # Reuses its threads across searches
+        self.search_signals = None  # Signals of the most recent search, the only one whose results are shown
 
         self.context_menu = QMenu(self)
         self.copy_action = QAction("Copy", self)
@@ -148,25 +224,15 @@ class HexViewer(QWidget):
         self.context_menu.exec_(self.mapToGlobal(pos))
 
     def copy_to_clipboard(self):
-        selected_text = ""
-
-        # Check if any cells in the hex_table are selected
-        selected_indexes = self.hex_table.selectedIndexes()
-        if selected_indexes:
-            # Sort the selected indexes by row
-            selected_indexes.sort(key=lambda index: index.row())
-
-            for i, index in enumerate(selected_indexes):
-                selected_text += index.data(Qt.DisplayRole)
-
-                if index.column() == 16:  # The last column (ASCII), add a newline
-                    selected_text += "\n"
-                else:
-                    next_index = selected_indexes[i + 1] if i + 1 < len(selected_indexes) else None
+        # Selection order follows how the cells were selected, so put them back in reading order
+        selected_indexes = sorted(self.hex_table.selectedIndexes(), key=lambda index: (index.row(), index.column()))
 
-                    # Add a space if the next cell is in the same row
-                    if next_index and next_index.row() == index.row():
-                        selected_text += " "
+        # One line per row with its cells separated by spaces, collected in lists and joined once
+        lines = []
+        for _, row_indexes in groupby(selected_indexes, key=lambda index: index.row()):
+            cells = (index.data(Qt.DisplayRole) for index in row_indexes)
+            lines.append(" ".join(cell for cell in cells if cell))  # Cells past the end of the file are empty
+        selected_text = "\n".join(lines)
 
         # Copy the selected text to the clipboard
         if selected_text:
@@ -214,6 +280,7 @@ class HexViewer(QWidget):
         self.search_results_widget.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)  # Show scroll bar when needed
         self.search_results_widget.itemClicked.connect(self.search_result_clicked)
         self.search_results_widget.setFont(QFont("Courier", 9))  # Smaller font
+        self.search_results_widget.setUniformItemSizes(True)  # All results are one line, so skip measuring each
         self.search_results_layout.addWidget(self.search_results_widget)
 
         self.search_results_frame.setLayout(self.search_results_layout)
@@ -348,6 +415,12 @@ class HexViewer(QWidget):
         self.search_bar.returnPressed.connect(self.trigger_search)
         self.toolbar.addWidget(self.search_bar)
 
+        # Text queries match case exactly unless this is unchecked; hex and address queries are unaffected
+        self.match_case_checkbox = QCheckBox("Match case", self)
+        self.match_case_checkbox.setChecked(True)
+        self.match_case_checkbox.setFixedHeight(25)
+        self.toolbar.addWidget(self.match_case_checkbox)
+
     def update_font_size(self):
         # Get the current font size from the combobox
         selected_size = int(self.font_size_combobox.currentText())
@@ -373,16 +446,7 @@ class HexViewer(QWidget):
         header_font.setPointSize(selected_size)
         self.hex_table.horizontalHeader().setFont(header_font)
 
-        # Apply the font to all existing data cells
-        for row in range(self.hex_table.rowCount()):
-            for col in range(self.hex_table.columnCount()):
-                item = self.hex_table.item(row, col)
-                if item:
-                    item_font = item.font()
-                    # Ensure we have a valid font size before setting it
-                    if selected_size > 0:
-                        item_font.setPointSize(selected_size)
-                        item.setFont(item_font)
+        # Cells take the table's font, so there is nothing to update per cell
 
         # Adjust the horizontal scrollbar policy if needed
         if self.hex_table.horizontalHeader().length() > self.hex_table.viewport().width():
@@ -391,7 +455,9 @@ class HexViewer(QWidget):
             self.hex_table.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
     def setup_hex_table(self):
-        self.hex_table = QTableWidget()
+        self.hex_table = QTableView()
+        self.hex_model = HexTableModel(self)
+        self.hex_table.setModel(self.hex_model)
         self.hex_table.verticalHeader().setDefaultSectionSize(20)  # Smaller row height
 
         # Set the font of the hex_table
@@ -400,9 +466,7 @@ class HexViewer(QWidget):
         font.setLetterSpacing(QFont.AbsoluteSpacing, 1)  # Reduce letter spacing
         self.hex_table.setFont(font)
 
-        # Configure the columns and headers
-        self.hex_table.setColumnCount(18)  # 16 bytes + 1 address + 1 ASCII
-        self.hex_table.setHorizontalHeaderLabels(['Address'] + [f'{i:02X}' for i in range(16)] + ['ASCII'])
+        # Columns and their headers come from the model: 16 bytes + 1 address + 1 ASCII
         self.hex_table.verticalHeader().setVisible(False)
 
         # Set resizing policies for the header
@@ -429,11 +493,11 @@ class HexViewer(QWidget):
         self.hex_table.setColumnWidth(17, 200)  # ASCII column initial width
 
         self.hex_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 gridline-color: transparent;
                 border: 1px solid #d3d3d3;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 0px;
                 border: none;
             }
@@ -443,13 +507,12 @@ class HexViewer(QWidget):
         self.hex_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
 
     def display_hex_content(self, file_content):
-        hex_content = file_content.hex()
         self.search_results_widget.clear()
         # self.search_results_frame.setVisible(False)
 
         # Clear the search bar text
         self.search_bar.setText("")
-        self.hex_viewer_manager = HexViewerManager(hex_content, file_content)
+        self.hex_viewer_manager = HexViewerManager(file_content)
         self.update_navigation_states()
         self.display_current_page()
         # clear the page number entry
@@ -490,39 +553,33 @@ class HexViewer(QWidget):
             text_file.write(formatted_hex)
 
     def export_as_html(self, file_name):
-        html_content = "<html><body>\n"
-        html_content += "<pre>\n"
-
-        # Add a smaller and less prominent header with the original text
-        header_line = '<div style="font-size:14px; color:#888;">Generated by Trace</div>'
-        html_content += header_line + "<br><br>\n"
+        # Written straight to the file piece by piece rather than concatenated into one string first
+        with open(file_name, "w") as html_file:
+            html_file.write("<html><body>\n")
+            html_file.write("<pre>\n")
 
-        # Add directory and file name information
-        directory, filename = os.path.split(file_name)
-        html_content += f'<span style="color:blue;">Directory: {directory}</span><br>\n'
-        html_content += f'<span style="color:blue;">File Name: {filename}</span><br><br>\n'
+            # Add a smaller and less prominent header with the original text
+            header_line = '<div style="font-size:14px; color:#888;">Generated by Trace</div>'
+            html_file.write(header_line + "<br><br>\n")
 
-        # Add the green header line
-        header_line = ('<span style="color:green;">Address     00 01 02 03 04 05 06 07 08 09 0A 0B 0C 0D 0E 0F        '
-                       'ASCII</span>')
-        html_content += header_line + "<br>\n"
+            # Add directory and file name information
+            directory, filename = os.path.split(file_name)
+            html_file.write(f'<span style="color:blue;">Directory: {escape(directory)}</span><br>\n')
+            html_file.write(f'<span style="color:blue;">File Name: {escape(filename)}</span><br><br>\n')
 
-        html_content += self.hex_viewer_manager.format_hex(self.current_page).replace("\n", "<br>")
-        html_content += "</pre>\n"
-        html_content += "</body></html>"
+            # Add the green header line
+            header_line = ('<span style="color:green;">Address     00 01 02 03 04 05 06 07 08 09 0A 0B 0C 0D 0E 0F        '
+                           'ASCII</span>')
+            html_file.write(header_line + "<br>\n")
 
-        with open(file_name, "w") as html_file:
-            html_file.write(html_content)
-
-    def parse_hex_line(self, line):
-        if ":" not in line:
-            return None, None, None
-        address, rest = line.split(":", maxsplit=1)
-        hex_chunk, ascii_repr = rest.split("  ", maxsplit=1)
-        return address.strip(), hex_chunk.strip(), ascii_repr.strip()
+            # The ASCII column can hold '<' and '&', which would otherwise be read as markup
+            formatted_hex = escape(self.hex_viewer_manager.format_hex(self.current_page), quote=False)
+            html_file.write(formatted_hex.replace("\n", "<br>"))
+            html_file.write("</pre>\n")
+            html_file.write("</body></html>")
 
     def clear_content(self):
-        self.hex_table.clear()
+        self.hex_model.set_page(0, b'')
 
     def load_first_page(self):
         try:
@@ -559,54 +616,8 @@ class HexViewer(QWidget):
         self.navigate_to_address(address)
 
     def display_current_page(self):
-        formatted_hex = self.hex_viewer_manager.format_hex(self.current_page)
-
-        # Clear the table first
-        self.hex_table.setRowCount(0)
-        self.hex_table.setHorizontalHeaderLabels(['Address'] + [f'{i:02X}' for i in range(16)] + ['ASCII'])
-
-        hex_lines = formatted_hex.split('\n')
-
-        # Ensure we set the correct row count
-        self.hex_table.setRowCount(len(hex_lines))
-
-        # Get the current font size with fallback to default
-        current_font = self.hex_table.font()
-        current_font_size = current_font.pointSize()
-        if current_font_size <= 0:  # Use default if invalid
-            current_font_size = 10  # Default font size
-
-        for row, line in enumerate(hex_lines):
-            address, hex_chunk, ascii_repr = self.parse_hex_line(line)
-            if not address or not hex_chunk:  # Skip if there's an error in parsing
-                continue
-
-            # Set address and center-align
-            address_item = QTableWidgetItem(address + ":")  # Add a colon after the address
-            address_item.setTextAlignment(Qt.AlignCenter)
-            item_font = address_item.font()
-            item_font.setPointSize(current_font_size)
-            address_item.setFont(item_font)
-            self.hex_table.setItem(row, 0, address_item)
-
-            # Set hex values and center-align
-            for col, byte in enumerate(hex_chunk.split()):
-                byte_item = QTableWidgetItem(byte)
-                byte_item.setTextAlignment(Qt.AlignCenter)
-                byte_item.setBackground(Qt.white)  # Clear any previous highlight
-                item_font = byte_item.font()
-                item_font.setPointSize(current_font_size)
-                byte_item.setFont(item_font)
-                self.hex_table.setItem(row, col + 1, byte_item)
-
-            # Set ASCII representation and center-align
-            ascii_item = QTableWidgetItem(ascii_repr)
-            ascii_item.setTextAlignment(Qt.AlignCenter)
-            item_font = ascii_item.font()
-            item_font.setPointSize(current_font_size)
-            ascii_item.setFont(item_font)
-            self.hex_table.setItem(row, 17, ascii_item)
-
+        page_offset, page_bytes = self.hex_viewer_manager.page_bytes(self.current_page)
+        self.hex_model.set_page(page_offset, page_bytes)
         self.update_navigation_states()
 
     def go_to_page_by_entry(self):
@@ -643,45 +654,25 @@ class HexViewer(QWidget):
             QMessageBox.warning(self, "Search Error", "Please enter a search query.")
             return
 
-        # Check if a search is already ongoing. If so, stop it before starting a new one.
-        if hasattr(self, 'search_thread') and self.search_thread.isRunning():
-            self.search_thread.quit()
-            self.search_thread.wait()
-
-        # Start the search in a new thread
-        self.search_thread = QThread()
-        self.search_worker = SearchWorker(self.hex_viewer_manager, query)
-        self.search_worker.moveToThread(self.search_thread)
-
-        # Connect signals and slots
-        self.search_worker.search_finished.connect(self.handle_search_results)
-        self.search_thread.started.connect(self.search_worker.run)
-        self.search_thread.finished.connect(self.cleanup_thread_resources)
-
-        # Start the thread
-        self.search_thread.start()
-
-    def cleanup_thread_resources(self):
-        # Ensure safe cleanup by checking the existence of resources before deleting
-        if hasattr(self, 'search_worker'):
-            self.search_worker.deleteLater()
-            del self.search_worker
-        if hasattr(self, 'search_thread'):
-            self.search_thread.deleteLater()
-            del self.search_thread
+        # A search still running can't be interrupted inside find(), so just stop listening to it
+        if self.search_signals is not None:
+            self.search_signals.search_finished.disconnect(self.handle_search_results)
+
+        # Run the search on a pooled thread; the pool deletes the worker once it has run
+        search_worker = SearchWorker(self.hex_viewer_manager, query, self.match_case_checkbox.isChecked())
+        self.search_signals = search_worker.signals
+        self.search_signals.search_finished.connect(self.handle_search_results)
+        self.search_pool.start(search_worker)
 
     def closeEvent(self, event):
-        if hasattr(self, 'search_thread') and self.search_thread.isRunning():
-            self.search_thread.quit()
-            self.search_thread.wait()
+        self.search_pool.waitForDone()
         super().closeEvent(event)
 
     def handle_search_results(self, matches):
         self.search_results_widget.clear()  # Clear previous results
         if matches:
-            for match in matches:
-                address = f"0x{match * 16:08x}"  # Calculate the address from line number
-                self.search_results_widget.addItem(f"Address: {address}")
+            # One addItems call inserts every result with a single layout pass
+            self.search_results_widget.addItems([f"Address: 0x{match * 16:08x}" for match in matches])
 
             # Show the search results frame and resize the splitter to allocate more space to results
             self.search_results_frame.setVisible(True)
@@ -700,17 +691,17 @@ class HexViewer(QWidget):
             # Determine the line number from the address
             line = address_int // 16
 
-            # The rest of the logic remains the same
-            self.current_page = line // self.hex_viewer_manager.LINES_PER_PAGE
-            self.display_current_page()
+            # Results on the page already shown only move the highlight, without resetting the model
+            page = line // self.hex_viewer_manager.LINES_PER_PAGE
+            if page != self.current_page:
+                self.current_page = page
+                self.display_current_page()
 
             # Navigate to the specific row on that page and highlight it
             row_in_page = line % self.hex_viewer_manager.LINES_PER_PAGE
             self.hex_table.selectRow(row_in_page)
-            for col in range(1, 17):
-                item = self.hex_table.item(row_in_page, col)
-                if item:
-                    item.setBackground(Qt.yellow)
+            self.hex_table.scrollTo(self.hex_model.index(row_in_page, 0))
+            self.hex_model.highlight_row(row_in_page)
             self.update_navigation_states()
         except ValueError:
             QMessageBox.warning(self, "Navigation Error", "Invalid address.")
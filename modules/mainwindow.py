@@ -8,6 +8,7 @@ import tempfile
 import gc
 import time
 import logging
+import mmap
 import re
 from typing import Optional, Dict, Any, List, Tuple
 from Registry import Registry
@@ -166,6 +167,7 @@ class ImageHandler:
         self.is_wiped_image = False
         self._directory_cache = {}  # Cache for directory contents
         self._partition_cache = None  # Cache for partitions
+        self._image_mmap = None  # Read-only memory map of a raw image, created on first use
 
         # Load the image with progress tracking
         self.load_image()
@@ -184,6 +186,14 @@ class ImageHandler:
                 except:
                     pass
 
+        # Release the memory map; views still held elsewhere keep it open until they are dropped
+        if self._image_mmap is not None:
+            try:
+                self._image_mmap.close()
+            except BufferError:
+                pass
+            self._image_mmap = None
+
         # Close the image
         if self.img_info:
             if hasattr(self.img_info, 'close'):
@@ -211,6 +221,28 @@ class ImageHandler:
         else:
             raise NotImplementedError("The image format does not support direct reading.")
 
+    def mmap(self):
+        """Memory-map a raw image for zero-copy access, or return None if it cannot be mapped.
+
+        EWF images are compressed and split raw images span several files, so those
+        still have to go through read().
+        """
+        if self._image_mmap is None:
+            if not self.img_info or self.get_image_type() != "raw":
+                return None
+            try:
+                with open(self.image_path, "rb") as image_file:
+                    image_mmap = mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError) as e:
+                logger.debug(f"Could not memory-map {self.image_path}: {e}")
+                return None
+            if len(image_mmap) != self.get_size():
+                # Only the first segment of a split image is in this file
+                image_mmap.close()
+                return None
+            self._image_mmap = image_mmap
+        return self._image_mmap
+
     def build_allocation_map(self, start_offset):
         """Build a map of allocated disk regions by traversing the filesystem."""
         allocation_map = []
@@ -2160,6 +2192,13 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Error shutting down application viewer: {e}")
 
+        # Stop the file carving thumbnail processes
+        try:
+            if hasattr(self, 'deleted_files_widget'):
+                self.deleted_files_widget.shutdown()
+        except Exception as e:
+            logger.error(f"Error shutting down file carving widget: {e}")
+
         # Stop any running background operations
         for attr_name in dir(self):
             attr = getattr(self, attr_name)